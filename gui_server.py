@@ -17,27 +17,515 @@ Exemplo:
     SW420_GRUPO_10,2025-11-04T15:30:45.123,2450,ADC
 """
 
+import ctypes
+import ctypes.util
+import errno
+import math
+import os
+import select
 import socket
 import signal
 import sys
 import threading
-import json
 import time
-from datetime import datetime
-from collections import deque
+from datetime import datetime, timezone
 from typing import Dict, Optional, Callable
 
+import numpy as np
+
+# Numba (opcional): tokenizador CSV compilado para o caminho quente
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # Configurações padrão
 DEFAULT_UDP_IP = "192.168.42.10"
 DEFAULT_UDP_PORT = 5000
 DEFAULT_MAX_HISTORY = 300  # Manter histórico dos últimos 5 minutos (300 segundos)
 DEFAULT_VIBRATION_THRESHOLD = 5000
+CSV_CHUNK_ROWS = 10000  # Linhas formatadas por escrita na exportação CSV
+# Nomes distintos de sensor/unidade guardados (qualquer remetente pode inventar
+# nomes); passado o limite, os novos vão para um nome comum
+MAX_DISTINCT_NAMES = 1024
+OVERFLOW_NAME = "(outros)"
+
+# Recepção em lote (recvmmsg, somente Linux)
+RECV_BUFFER_SIZE = 1024  # Tamanho máximo de cada datagrama
+RECV_BATCH_SIZE = 64     # Datagramas lidos por chamada de sistema
+MSG_WAITFORONE = 0x10000
+
+# Ajustes do socket de recepção
+SOCKET_RCVBUF_SIZE = 8 * 1024 * 1024  # Limitado por net.core.rmem_max
+BUSY_POLL_US = 50                     # Acima de net.core.busy_read exige CAP_NET_ADMIN
+SO_BUSY_POLL = getattr(socket, 'SO_BUSY_POLL', 46)
+SO_INCOMING_CPU = getattr(socket, 'SO_INCOMING_CPU', 49)
+_rcvbuf_hint_shown = False  # A dica do rmem_max aparece uma vez por processo
+
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [('iov_base', ctypes.c_void_p), ('iov_len', ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [('msg_name', ctypes.c_void_p), ('msg_namelen', ctypes.c_uint32),
+                ('msg_iov', ctypes.POINTER(_IOVec)), ('msg_iovlen', ctypes.c_size_t),
+                ('msg_control', ctypes.c_void_p), ('msg_controllen', ctypes.c_size_t),
+                ('msg_flags', ctypes.c_int)]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [('msg_hdr', _MsgHdr), ('msg_len', ctypes.c_uint)]
+
+
+class _MMsgReceiver:
+    """Recebe vários datagramas por chamada de sistema via recvmmsg (Linux)"""
+
+    _SOCKADDR_SIZE = 16  # sizeof(struct sockaddr_in)
+
+    def __init__(self, fd: int, batch_size: int = RECV_BATCH_SIZE,
+                 buffer_size: int = RECV_BUFFER_SIZE):
+        """
+        Pré-aloca buffers e estruturas usados em todas as chamadas
+
+        Args:
+            fd: Descritor do socket UDP (IPv4)
+            batch_size: Número máximo de datagramas por chamada
+            buffer_size: Tamanho de cada buffer de recepção
+
+        Raises:
+            OSError: Se recvmmsg não estiver disponível na libc
+        """
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._recvmmsg = libc.recvmmsg
+        self._recvmmsg.argtypes = [ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint,
+                                   ctypes.c_int, ctypes.c_void_p]
+        self._recvmmsg.restype = ctypes.c_int
+
+        self.fd = fd
+        self.batch_size = batch_size
+        self.buffer_size = buffer_size
+        # Um único bloco contíguo: o slot i ocupa [i*buffer_size, (i+1)*buffer_size)
+        self.buffer = bytearray(batch_size * buffer_size)
+        self._c_buffer = (ctypes.c_char * len(self.buffer)).from_buffer(self.buffer)
+        self._names = [ctypes.create_string_buffer(self._SOCKADDR_SIZE) for _ in range(batch_size)]
+        self._iovecs = (_IOVec * batch_size)()
+        self.msgs = (_MMsgHdr * batch_size)()
+
+        base = ctypes.addressof(self._c_buffer)
+        for i in range(batch_size):
+            self._iovecs[i].iov_base = base + i * buffer_size
+            self._iovecs[i].iov_len = buffer_size
+            hdr = self.msgs[i].msg_hdr
+            hdr.msg_name = ctypes.addressof(self._names[i])
+            hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            hdr.msg_iovlen = 1
+
+    def receive(self) -> int:
+        """
+        Lê os datagramas disponíveis para os buffers pré-alocados
+
+        Returns:
+            Número de datagramas recebidos (0 se não houver dados)
+        """
+        for i in range(self.batch_size):
+            self.msgs[i].msg_hdr.msg_namelen = self._SOCKADDR_SIZE
+
+        count = self._recvmmsg(self.fd, self.msgs, self.batch_size, MSG_WAITFORONE, None)
+        if count < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                return 0
+            raise OSError(err, f"recvmmsg: {errno.errorcode.get(err, err)}")
+        return count
+
+    def address(self, i: int) -> tuple:
+        """Retorna o endereço (ip, porta) do remetente do datagrama i"""
+        name = self._names[i].raw
+        return socket.inet_ntoa(name[4:8]), int.from_bytes(name[2:4], 'big')
+
+    def payload(self, i: int) -> bytes:
+        """Retorna uma cópia do conteúdo do datagrama i"""
+        offset = i * self.buffer_size
+        return bytes(self.buffer[offset:offset + self.msgs[i].msg_len])
+
+
+def _parse_csv_bytes(buf):
+    """
+    Tokeniza "SENSOR_ID,TIMESTAMP,VALUE,UNIT" diretamente sobre os bytes
+
+    Percorre o buffer uma única vez: localiza as 3 vírgulas, calcula um hash
+    FNV-1a do sensor e da unidade, converte o timestamp ISO 8601 em
+    microssegundos desde a época e o valor em float (parser estilo xstrtod).
+
+    Args:
+        buf: Datagrama como array uint8
+
+    Returns:
+        Tupla (ok, sensor_hash, unit_hash, ts_us, value, start, c1, c2, c3, end)
+    """
+    fnv_offset = np.uint64(14695981039346656037)
+    fnv_prime = np.uint64(1099511628211)
+    fail = (False, np.uint64(0), np.uint64(0), np.int64(0), 0.0, 0, 0, 0, 0, 0)
+
+    # strip()
+    start = 0
+    end = len(buf)
+    while start < end and buf[start] <= 32:
+        start += 1
+    while end > start and buf[end - 1] <= 32:
+        end -= 1
+
+    # Vírgulas
+    c1 = -1
+    c2 = -1
+    c3 = -1
+    for i in range(start, end):
+        if buf[i] == 44:
+            if c1 < 0:
+                c1 = i
+            elif c2 < 0:
+                c2 = i
+            elif c3 < 0:
+                c3 = i
+            else:
+                return fail
+    if c3 < 0:
+        return fail
+
+    sensor_hash = fnv_offset
+    for i in range(start, c1):
+        sensor_hash = (sensor_hash ^ np.uint64(buf[i])) * fnv_prime
+    unit_hash = fnv_offset
+    for i in range(c3 + 1, end):
+        unit_hash = (unit_hash ^ np.uint64(buf[i])) * fnv_prime
+
+    # Timestamp: YYYY-MM-DDTHH:MM:SS[.ffffff][Z|+HH:MM|-HH:MM]
+    p = c1 + 1
+    if c2 - p < 19:
+        return fail
+    fields = np.zeros(6, np.int64)
+    widths = (4, 2, 2, 2, 2, 2)
+    for f in range(6):
+        v = 0
+        for _ in range(widths[f]):
+            d = buf[p] - 48
+            if d < 0 or d > 9:
+                return fail
+            v = v * 10 + d
+            p += 1
+        fields[f] = v
+        if f < 5:
+            sep = buf[p]
+            if f == 2:
+                if sep != 84 and sep != 32:  # 'T' ou ' '
+                    return fail
+            elif f < 2:
+                if sep != 45:  # '-'
+                    return fail
+            elif sep != 58:  # ':'
+                return fail
+            p += 1
+    year, month, day = fields[0], fields[1], fields[2]
+    hour, minute, second = fields[3], fields[4], fields[5]
+    if month < 1 or month > 12 or day < 1 or hour > 23 or minute > 59 or second > 59:
+        return fail
+    month_days = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+    leap = (year % 4 == 0 and year % 100 != 0) or year % 400 == 0
+    if day > month_days[month - 1] + (1 if month == 2 and leap else 0):
+        return fail
+
+    micros = 0
+    if p < c2 and buf[p] == 46:  # '.'
+        p += 1
+        ndigits = 0
+        while p < c2 and 48 <= buf[p] <= 57:
+            if ndigits < 6:
+                micros = micros * 10 + (buf[p] - 48)
+            ndigits += 1
+            p += 1
+        if ndigits == 0:
+            return fail
+        for _ in range(ndigits, 6):
+            micros *= 10
+
+    offset_s = 0
+    if p < c2:
+        if buf[p] == 90 and p + 1 == c2:  # 'Z'
+            p += 1
+        elif buf[p] == 43 or buf[p] == 45:  # '+' ou '-'
+            sign = 1 if buf[p] == 43 else -1
+            p += 1
+            digits = np.zeros(4, np.int64)
+            n = 0
+            while p < c2 and n < 4:
+                if buf[p] == 58:
+                    p += 1
+                    continue
+                d = buf[p] - 48
+                if d < 0 or d > 9:
+                    return fail
+                digits[n] = d
+                n += 1
+                p += 1
+            if n != 4 or p != c2:
+                return fail
+            offset_s = sign * ((digits[0] * 10 + digits[1]) * 3600 + (digits[2] * 10 + digits[3]) * 60)
+        else:
+            return fail
+
+    # Dias desde 1970-01-01 (algoritmo days_from_civil)
+    y = year - 1 if month <= 2 else year
+    era = (y if y >= 0 else y - 399) // 400
+    yoe = y - era * 400
+    mp = month - 3 if month > 2 else month + 9
+    doy = (153 * mp + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    days = era * 146097 + doe - 719468
+    ts_us = np.int64(((days * 24 + hour) * 60 + minute) * 60 + second - offset_s) * 1000000 + micros
+
+    # Valor: [+-]digitos[.digitos][(e|E)[+-]digitos]
+    p = c2 + 1
+    negative = False
+    if p < c3 and (buf[p] == 43 or buf[p] == 45):
+        negative = buf[p] == 45
+        p += 1
+    mantissa = 0
+    exp10 = 0
+    ndigits = 0
+    sig_digits = 0  # Dígitos a partir do primeiro não nulo
+    while p < c3 and 48 <= buf[p] <= 57:
+        if mantissa > 0 or buf[p] != 48:
+            sig_digits += 1
+        if sig_digits <= 15:
+            mantissa = mantissa * 10 + (buf[p] - 48)
+        else:
+            exp10 += 1
+        ndigits += 1
+        p += 1
+    if p < c3 and buf[p] == 46:
+        p += 1
+        while p < c3 and 48 <= buf[p] <= 57:
+            if mantissa > 0 or buf[p] != 48:
+                sig_digits += 1
+            if sig_digits <= 15:
+                mantissa = mantissa * 10 + (buf[p] - 48)
+                exp10 -= 1
+            ndigits += 1
+            p += 1
+    if ndigits == 0:
+        return fail
+    if p < c3 and (buf[p] == 101 or buf[p] == 69):
+        p += 1
+        exp_sign = 1
+        if p < c3 and (buf[p] == 43 or buf[p] == 45):
+            exp_sign = -1 if buf[p] == 45 else 1
+            p += 1
+        exp_val = 0
+        exp_digits = 0
+        while p < c3 and 48 <= buf[p] <= 57:
+            if exp_val < 100000:
+                exp_val = exp_val * 10 + (buf[p] - 48)
+            exp_digits += 1
+            p += 1
+        if exp_digits == 0:
+            return fail
+        exp10 += exp_sign * exp_val
+    if p != c3:
+        return fail
+
+    if mantissa == 0:
+        value = 0.0
+    elif sig_digits > 15 or exp10 > 22 or exp10 < -22:
+        # Fora da faixa em que a conta abaixo é exata: float() resolve
+        return fail
+    else:
+        # Mantissa até 15 dígitos e potências de 10 até 1e22 são exatas em float64,
+        # então uma única multiplicação/divisão sai arredondada corretamente
+        value = float(mantissa)
+        if exp10 >= 0:
+            value = value * 10.0 ** exp10
+        else:
+            value = value / 10.0 ** (-exp10)
+    if negative:
+        value = -value
+
+    return (True, sensor_hash, unit_hash, ts_us, value, start, c1, c2, c3, end)
+
+
+def _parse_csv_batch(bufs, lengths, count, ok, hashes, ts_us, values, bounds):
+    """
+    Tokeniza um lote de datagramas em uma única chamada compilada
+
+    Args:
+        bufs: Matriz uint8 (lote, tamanho do buffer) com os datagramas
+        lengths: Tamanho de cada datagrama
+        count: Número de datagramas válidos no lote
+        ok, hashes, ts_us, values, bounds: Arrays de saída pré-alocados
+    """
+    for i in range(count):
+        (ok[i], hashes[i, 0], hashes[i, 1], ts_us[i], values[i],
+         bounds[i, 0], bounds[i, 1], bounds[i, 2], bounds[i, 3], bounds[i, 4]) = \
+            _parse_csv_nb(bufs[i, :lengths[i]])
+
+
+# nogil: o lote é tokenizado sem o GIL, liberando a thread da GUI durante o parse
+if njit:
+    _parse_csv_nb = njit(cache=True, nogil=True)(_parse_csv_bytes)
+    _parse_csv_batch_nb = njit(cache=True, nogil=True)(_parse_csv_batch)
+else:
+    _parse_csv_nb = None
+    _parse_csv_batch_nb = None
+
+
+def _iso_to_us(timestamp: str) -> int:
+    """
+    Converte um timestamp ISO 8601 em microssegundos desde a época
+
+    Args:
+        timestamp: Timestamp ISO 8601 (sem fuso é tratado como UTC)
+
+    Returns:
+        Microssegundos desde 1970-01-01T00:00:00Z
+    """
+    if timestamp.endswith('Z'):
+        timestamp = timestamp[:-1] + '+00:00'
+    dt = datetime.fromisoformat(timestamp)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    delta = dt - datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+def _has_utc_offset(timestamp: str) -> bool:
+    """Indica se o timestamp ISO 8601 traz fuso ('Z' ou ±HH:MM) depois da data"""
+    time_part = timestamp[10:]
+    return time_part.endswith('Z') or '+' in time_part or '-' in time_part
+
+
+def _tune_socket(sock: socket.socket, cpu: Optional[int] = None):
+    """
+    Aumenta o buffer de recepção e ativa busy polling/afinidade quando possível
+
+    Args:
+        sock: Socket UDP a ajustar
+        cpu: CPU da thread que lê o socket (None = sem afinidade)
+    """
+    options = [(socket.SO_RCVBUF, SOCKET_RCVBUF_SIZE)]
+    if sys.platform.startswith('linux'):
+        options.append((SO_BUSY_POLL, BUSY_POLL_US))
+        if cpu is not None:
+            options.append((SO_INCOMING_CPU, cpu))
+    for option, value in options:
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, option, value)
+        except OSError:
+            pass  # Sem permissão ou não suportado: mantém o padrão do sistema
+
+    # O Linux devolve o dobro do tamanho concedido; abaixo do pedido, o
+    # net.core.rmem_max o limitou (o normal numa instalação padrão: só uma dica)
+    global _rcvbuf_hint_shown
+    granted = sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+    if sys.platform.startswith('linux'):
+        granted //= 2
+    if granted < SOCKET_RCVBUF_SIZE and not _rcvbuf_hint_shown:
+        _rcvbuf_hint_shown = True
+        print(f"[INFO] SO_RCVBUF de {granted} bytes (pedido: {SOCKET_RCVBUF_SIZE}); "
+              f"para rajadas maiores sem descarte, aumente net.core.rmem_max")
+
+
+class _SocketReader:
+    """Socket de um worker de recepção com seus buffers pré-alocados"""
+
+    def __init__(self, sock: socket.socket, cpu: Optional[int] = None):
+        """
+        Prepara a recepção em lote para o socket
+
+        Args:
+            sock: Socket UDP já vinculado
+            cpu: CPU em que a thread deste worker deve rodar (None = qualquer)
+        """
+        self.sock = sock
+        self.cpu = cpu
+
+        # Destino fixo do recvfrom_into; o parse lê direto da visão, sem cópia
+        self.recv_buf = bytearray(RECV_BUFFER_SIZE)
+        self.recv_view = memoryview(self.recv_buf)
+
+        # Caminho rápido no Linux: buffers alocados uma única vez aqui
+        self.mmsg = None
+        if sys.platform.startswith('linux'):
+            try:
+                self.mmsg = _MMsgReceiver(sock.fileno())
+            except (OSError, AttributeError) as e:
+                print(f"[WARN] recvmmsg indisponível, usando recvfrom: {e}")
+        self.batch_parser = bool(self.mmsg and _parse_csv_batch_nb)
+        if self.batch_parser:
+            self._init_batch_parser()
+
+    def _init_batch_parser(self):
+        """Cria as visões NumPy sobre os buffers do recvmmsg e as saídas do tokenizador"""
+        batch = self.mmsg.batch_size
+        self.batch_bufs = np.frombuffer(self.mmsg.buffer, dtype=np.uint8).reshape(
+            batch, self.mmsg.buffer_size)
+        msgs = self.mmsg.msgs
+        raw = (ctypes.c_char * ctypes.sizeof(msgs)).from_address(ctypes.addressof(msgs))
+        self.batch_lengths = np.ndarray((batch,), dtype=np.uint32, buffer=raw,
+                                         offset=_MMsgHdr.msg_len.offset,
+                                         strides=(ctypes.sizeof(_MMsgHdr),))
+        self.batch_ok = np.zeros(batch, dtype=np.bool_)
+        self.batch_hashes = np.zeros((batch, 2), dtype=np.uint64)
+        self.batch_ts_us = np.zeros(batch, dtype=np.int64)
+        self.batch_values = np.zeros(batch, dtype=np.float64)
+        self.batch_bounds = np.zeros((batch, 5), dtype=np.int64)
+
+    def warm_up(self):
+        """
+        Compila os tokenizadores Numba usados por este worker antes do primeiro pacote
+
+        Chamado na thread do worker: com o cache do Numba frio a compilação leva
+        alguns segundos e não pode travar a thread da GUI que chamou start().
+        """
+        if self.batch_parser:
+            self.tokenize(0)
+        elif _parse_csv_nb:
+            # Variantes para buffer gravável (recvfrom_into) e bytes (payload do recvmmsg)
+            _parse_csv_nb(np.frombuffer(self.recv_buf, dtype=np.uint8)[:0])
+            _parse_csv_nb(np.frombuffer(b'', dtype=np.uint8))
+
+    def tokenize(self, count: int):
+        """
+        Tokeniza os datagramas do último recvmmsg com uma única chamada Numba
+
+        Args:
+            count: Número de datagramas no lote
+        """
+        _parse_csv_batch_nb(self.batch_bufs, self.batch_lengths, count, self.batch_ok,
+                            self.batch_hashes, self.batch_ts_us, self.batch_values,
+                            self.batch_bounds)
+
+    def receive_batch(self) -> int:
+        """
+        Aguarda dados e lê um lote com recvmmsg
+
+        Returns:
+            Número de datagramas recebidos
+        """
+        # O timeout do socket deixa o descritor não bloqueante; select faz a espera
+        readable, _, _ = select.select([self.sock], [], [], 1.0)
+        if not readable:
+            return 0
+        return self.mmsg.receive()
 
 
 class SensorData:
     """Classe para armazenar dados individuais do sensor"""
 
-    def __init__(self, sensor_id: str, timestamp: str, value: float, unit: str):
+    # Um objeto por pacote: atributos fixos, sem __dict__ por instância
+    __slots__ = ('sensor_id', 'timestamp', 'value', 'unit', 'ts_us', '_datetime_obj')
+
+    def __init__(self, sensor_id: str, timestamp: str, value: float, unit: str,
+                 ts_us: Optional[int] = None):
         """
         Inicializa dados do sensor
 
@@ -46,12 +534,24 @@ class SensorData:
             timestamp: Timestamp da leitura (ISO 8601)
             value: Valor lido do sensor
             unit: Unidade de medida (ex: "ADC", "mV", "g")
+            ts_us: Timestamp em microssegundos desde a época, se já conhecido
         """
         self.sensor_id = sensor_id
         self.timestamp = timestamp
         self.value = float(value)
         self.unit = unit
-        self.datetime_obj = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+        self.ts_us = ts_us
+        self._datetime_obj = None
+
+    @property
+    def datetime_obj(self) -> datetime:
+        """Timestamp como datetime, parseado apenas no primeiro acesso"""
+        if self._datetime_obj is None:
+            timestamp = self.timestamp
+            if timestamp.endswith('Z'):
+                timestamp = timestamp[:-1] + '+00:00'
+            self._datetime_obj = datetime.fromisoformat(timestamp)
+        return self._datetime_obj
 
     def to_dict(self) -> Dict:
         """Converte para dicionário"""
@@ -70,7 +570,7 @@ class UDPServer:
     """Servidor UDP para recebimento de dados de sensores com suporte a callbacks"""
 
     def __init__(self, ip: str = DEFAULT_UDP_IP, port: int = DEFAULT_UDP_PORT,
-                 max_history: int = DEFAULT_MAX_HISTORY):
+                 max_history: int = DEFAULT_MAX_HISTORY, num_workers: int = 1):
         """
         Inicializa servidor UDP
 
@@ -78,26 +578,51 @@ class UDPServer:
             ip: Endereço IP para bind
             port: Porta UDP
             max_history: Número máximo de dados a manter no histórico
+            num_workers: Sockets/threads de recepção com SO_REUSEPORT (Linux).
+                O kernel distribui por fluxo, então só ajuda com vários sensores
         """
         self.ip = ip
         self.port = port
         self.sock = None
+        self.num_workers = max(1, num_workers)
+        self.readers = []  # Um _SocketReader por worker
         self.running = False
-        self.thread = None
+        self.threads = []
+        self._lock = threading.Lock()  # Protege histórico e estatísticas entre workers
         self.max_history = max_history
 
         # Dados do sensor
         self.sensor_id = None
         self.current_data = None
-        self.history = deque(maxlen=max_history)
         self.client_address = None
 
+        # Histórico em buffer circular SoA (um array por campo). Um único produtor
+        # escreve; leitores copiam sem lock e descartam posições sobrescritas na cópia
+        self._ts_us = np.empty(max_history, dtype='i8')
+        self._ts_zoned = np.empty(max_history, dtype=np.bool_)  # Timestamp veio com fuso
+        self._val = np.empty(max_history, dtype='f8')
+        self._sensor_idx = np.empty(max_history, dtype='i4')
+        self._unit_idx = np.empty(max_history, dtype='i4')
+        self._written = 0  # Leituras publicadas (contador monotônico)
+        self._claimed = 0  # Leituras publicadas ou em gravação
+        self._sensor_table = []  # índice -> sensor_id
+        self._unit_table = []    # índice -> unidade
+        self._sensor_index = {}  # sensor_id -> índice
+        self._unit_index = {}    # unidade -> índice
+
         # Estatísticas
         self.total_readings = 0
         self.min_value = float('inf')
         self.max_value = 0
-        self.sum_values = 0
         self.high_vibration_events = 0
+        self._mean = 0.0  # Média incremental (Welford)
+        self._M2 = 0.0    # Soma dos quadrados dos desvios (Welford)
+
+        # Nomes de sensor/unidade já vistos, indexados pelo hash do tokenizador
+        self._sensor_names = {}
+        self._unit_names = {}
+        # Mesma ideia no caminho split: uma única instância de cada nome
+        self._interned_names = {}
 
         # Callbacks para atualizações em tempo real
         self.on_data_received = None
@@ -123,10 +648,26 @@ class UDPServer:
             True se inicializado com sucesso, False caso contrário
         """
         try:
-            self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.sock.bind((self.ip, self.port))
-            self.sock.settimeout(1.0)  # Timeout para permitir shutdown gracioso
+            # Vários sockets na mesma porta: o kernel balanceia os fluxos entre eles
+            workers = self.num_workers if hasattr(socket, 'SO_REUSEPORT') else 1
+
+            # Com vários workers, cada um fica em uma CPU e recebe os fluxos dela
+            cpus = None
+            if workers > 1 and hasattr(os, 'sched_getaffinity'):
+                cpus = sorted(os.sched_getaffinity(0))
+
+            self.readers = []
+            for i in range(workers):
+                cpu = cpus[i % len(cpus)] if cpus else None
+                sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                if workers > 1:
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+                _tune_socket(sock, cpu)
+                sock.bind((self.ip, self.port))
+                sock.settimeout(1.0)  # Timeout para permitir shutdown gracioso
+                self.readers.append(_SocketReader(sock, cpu))
+            self.sock = self.readers[0].sock
             return True
         except Exception as e:
             error_msg = f"Erro ao inicializar socket: {e}"
@@ -135,6 +676,16 @@ class UDPServer:
             print(f"❌ {error_msg}")
             return False
 
+    def _lookup_name(self, cache: dict, key, raw) -> str:
+        """Retorna o nome associado ao hash, decodificando-o na primeira ocorrência"""
+        name = cache.get(key)
+        if name is None:
+            # Mesmo critério do caminho genérico: bytes inválidos não derrubam a leitura
+            name = bytes(raw).decode('utf-8', errors='replace')
+            if len(cache) < MAX_DISTINCT_NAMES:
+                cache[key] = name
+        return name
+
     def parse_csv_message(self, message: str) -> Optional[SensorData]:
         """
         Parseia mensagem CSV do sensor
@@ -152,28 +703,220 @@ class UDPServer:
 
             sensor_id, timestamp, value, unit = parts
 
-            # Validação básica
+            # Validação básica (o float convertido aqui é o que vai para SensorData)
             try:
-                float(value)
+                value = float(value)
             except ValueError:
                 return None
 
-            return SensorData(sensor_id, timestamp, value, unit)
+            # Reaproveita a string já vista (com hash em cache) para sensor e unidade
+            names = self._interned_names
+            if len(names) < MAX_DISTINCT_NAMES:
+                sensor_id = names.setdefault(sensor_id, sensor_id)
+                unit = names.setdefault(unit, unit)
+            else:
+                sensor_id = names.get(sensor_id, sensor_id)
+                unit = names.get(unit, unit)
+            try:
+                ts_us = _iso_to_us(timestamp)
+            except ValueError:
+                # Timestamp fora do ISO 8601 (ou data inválida): a leitura é mantida
+                # e o histórico usa a hora de chegada
+                ts_us = None
+            return SensorData(sensor_id, timestamp, value, unit, ts_us)
         except Exception as e:
-            error_msg = f"Erro ao fazer parse: {e}"
-            if self.on_error:
-                self.on_error(error_msg)
+            self._report_parse_error(e)
             return None
 
+    def _report_parse_error(self, error: Exception):
+        """Informa um datagrama descartado; os demais do lote seguem normalmente"""
+        error_msg = f"Erro ao fazer parse: {error}"
+        if self.on_error:
+            self.on_error(error_msg)
+
+    def parse_csv_bytes(self, data) -> Optional[SensorData]:
+        """
+        Parseia o datagrama bruto, usando o tokenizador Numba se disponível
+
+        Args:
+            data: bytes ou memoryview no formato "SENSOR_ID,TIMESTAMP,VALUE,UNIT"
+
+        Returns:
+            SensorData se válido, None caso contrário
+        """
+        if _parse_csv_nb is None:
+            return self.parse_csv_message(str(data, 'utf-8', errors='replace'))
+
+        # Um datagrama malformado só descarta a si mesmo
+        try:
+            ok, sensor_hash, unit_hash, ts_us, value, start, c1, c2, c3, end = \
+                _parse_csv_nb(np.frombuffer(data, dtype=np.uint8))
+            if not ok:
+                # Formatos que o tokenizador não cobre seguem pelo caminho genérico
+                return self.parse_csv_message(str(data, 'utf-8', errors='replace'))
+
+            sensor_id = self._lookup_name(self._sensor_names, int(sensor_hash), data[start:c1])
+            unit = self._lookup_name(self._unit_names, int(unit_hash), data[c3 + 1:end])
+            return SensorData(sensor_id, str(data[c1 + 1:c2], 'ascii'), value, unit,
+                              int(ts_us))
+        except Exception as e:
+            self._report_parse_error(e)
+            return None
+
+    def _parse_batch(self, reader: _SocketReader, count: int) -> list:
+        """
+        Parseia os datagramas do último recvmmsg com uma única chamada Numba
+
+        Args:
+            reader: Worker que recebeu o lote
+            count: Número de datagramas no lote
+
+        Returns:
+            Lista de tuplas (SensorData ou None, endereço)
+        """
+        reader.tokenize(count)
+        mmsg = reader.mmsg
+        buf = mmsg.buffer
+        size = mmsg.buffer_size
+        results = []
+        for i in range(count):
+            addr = mmsg.address(i)
+            if not reader.batch_ok[i]:
+                message = mmsg.payload(i).decode('utf-8', errors='replace')
+                results.append((self.parse_csv_message(message), addr))
+                continue
+            # Um datagrama malformado só descarta a si mesmo, não o lote inteiro
+            try:
+                base = i * size
+                start, c1, c2, c3, end = (base + int(b) for b in reader.batch_bounds[i])
+                sensor_id = self._lookup_name(self._sensor_names,
+                                              int(reader.batch_hashes[i, 0]), buf[start:c1])
+                unit = self._lookup_name(self._unit_names, int(reader.batch_hashes[i, 1]),
+                                         buf[c3 + 1:end])
+                timestamp = buf[c1 + 1:c2].decode('ascii')
+                results.append((SensorData(sensor_id, timestamp, float(reader.batch_values[i]),
+                                           unit, int(reader.batch_ts_us[i])), addr))
+            except Exception as e:
+                self._report_parse_error(e)
+        return results
+
+    def _table_index(self, index: dict, table: list, name: str) -> int:
+        """
+        Retorna o índice de um nome na tabela, cadastrando-o na primeira ocorrência
+
+        Com a tabela cheia, nomes novos recebem o índice de OVERFLOW_NAME
+        (a última vaga fica reservada para ele).
+        """
+        idx = index.get(name)
+        if idx is None:
+            if len(table) >= MAX_DISTINCT_NAMES - 1:
+                name = OVERFLOW_NAME
+                idx = index.get(name)
+                if idx is not None:
+                    return idx
+            idx = index[name] = len(table)
+            table.append(name)
+        return idx
+
+    def _append_history(self, data: SensorData):
+        """Grava a leitura na próxima posição do buffer circular e a publica"""
+        written = self._written
+        self._claimed = written + 1
+        head = written % self.max_history
+        ts_us = data.ts_us
+        zoned = _has_utc_offset(data.timestamp)
+        if ts_us is None:
+            try:
+                ts_us = _iso_to_us(data.timestamp)
+            except ValueError:
+                # Hora de chegada: instante UTC, exportado com 'Z'
+                ts_us = time.time_ns() // 1000
+                zoned = True
+        self._ts_us[head] = ts_us
+        self._ts_zoned[head] = zoned
+        self._val[head] = data.value
+        self._sensor_idx[head] = self._table_index(self._sensor_index, self._sensor_table,
+                                                   data.sensor_id)
+        self._unit_idx[head] = self._table_index(self._unit_index, self._unit_table, data.unit)
+        # Publica só depois de gravar todos os campos
+        self._written = written + 1
+
+    def _snapshot(self) -> tuple:
+        """
+        Copia o histórico publicado em ordem cronológica, sem bloquear o produtor
+
+        Returns:
+            Tupla (ts_us, com_fuso, valores, índices de sensor, índices de unidade)
+        """
+        size = self.max_history
+        end = self._written
+        start = max(0, end - size)
+        positions = np.arange(start, end) % size
+        columns = [arr.take(positions)
+                   for arr in (self._ts_us, self._ts_zoned, self._val, self._sensor_idx,
+                               self._unit_idx)]
+
+        # Posições reaproveitadas pelo produtor durante a cópia (incluindo a que
+        # pode estar sendo gravada agora) são descartadas
+        torn = self._claimed - size - start
+        if torn > 0:
+            columns = [column[torn:] for column in columns]
+        return tuple(columns)
+
+    def _name_columns(self, sensor_idx: np.ndarray, unit_idx: np.ndarray) -> tuple:
+        """Converte índices de sensor/unidade de um snapshot nos nomes correspondentes"""
+        # As tabelas só crescem e são lidas depois do snapshot, então cobrem seus índices
+        sensors = np.array(self._sensor_table, dtype=object)
+        units = np.array(self._unit_table, dtype=object)
+        return sensors[sensor_idx], units[unit_idx]
+
+    @property
+    def history_count(self) -> int:
+        """Número de leituras no histórico"""
+        return min(self._written, self.max_history)
+
+    def get_history_columns(self) -> Dict[str, np.ndarray]:
+        """
+        Retorna o histórico como colunas em ordem cronológica
+
+        Returns:
+            Dicionário com arrays 'sensor_id', 'timestamp' (ISO 8601), 'value' e 'unit'.
+            Timestamps enviados com fuso saem em UTC com 'Z'; os enviados sem fuso
+            saem com a mesma data/hora local recebida, também sem fuso
+        """
+        ts_us, zoned, values, sensor_idx, unit_idx = self._snapshot()
+        sensors, units = self._name_columns(sensor_idx, unit_idx)
+        moments = ts_us.astype('datetime64[us]')
+        # Sem fuso, _iso_to_us guardou a hora local como se fosse UTC: a forma
+        # sem 'Z' devolve o texto original (com microssegundos)
+        timestamps = np.datetime_as_string(moments, timezone='UTC')
+        naive = ~zoned
+        if naive.any():
+            timestamps[naive] = np.datetime_as_string(moments[naive])
+        return {
+            'sensor_id': sensors,
+            'timestamp': timestamps,
+            'value': values,
+            'unit': units,
+        }
+
     def update_stats(self, data: SensorData):
         """Atualiza estatísticas com novo valor"""
         value = data.value
+        # Conta a leitura só depois de gravada: um erro no histórico não
+        # deixa contadores e buffer fora de sincronia
+        self._append_history(data)
         self.total_readings += 1
-        self.history.append(data)
-        self.sum_values += value
-        self.min_value = min(self.min_value, value)
-        self.max_value = max(self.max_value, value)
 
+        # Média e variância pelo algoritmo de Welford (estável numericamente)
+        delta = value - self._mean
+        self._mean += delta / self.total_readings
+        self._M2 += delta * (value - self._mean)
+
+        if value < self.min_value:
+            self.min_value = value
+        if value > self.max_value:
+            self.max_value = value
         if value > DEFAULT_VIBRATION_THRESHOLD:
             self.high_vibration_events += 1
 
@@ -187,58 +930,111 @@ class UDPServer:
         if self.total_readings == 0:
             return {}
 
-        avg_value = self.sum_values / self.total_readings
+        variance = self._M2 / (self.total_readings - 1) if self.total_readings > 1 else 0.0
         return {
             'total_readings': self.total_readings,
             'min_value': self.min_value,
             'max_value': self.max_value,
-            'avg_value': round(avg_value, 2),
+            'avg_value': round(self._mean, 2),
+            'std_value': round(variance ** 0.5, 2),
             'high_vibration_events': self.high_vibration_events,
             'last_timestamp': self.current_data.timestamp if self.current_data else None
         }
 
     def get_history_data(self) -> list:
         """Retorna histórico de dados como lista"""
-        return [data.to_dict() for data in self.history]
+        columns = self.get_history_columns()
+        return [
+            {'sensor_id': sensor_id, 'timestamp': timestamp, 'value': value, 'unit': unit}
+            for sensor_id, timestamp, value, unit in zip(
+                columns['sensor_id'], columns['timestamp'].tolist(), columns['value'].tolist(), columns['unit'])
+        ]
 
-    def _receive_loop(self):
-        """Loop de recepção de dados (executado em thread)"""
-        print(f"[INFO] Servidor UDP iniciado em {self.ip}:{self.port}")
+    def _accept(self, parsed_data: Optional[SensorData], addr: tuple):
+        """
+        Registra uma leitura já parseada
 
-        while self.running:
-            try:
-                data, addr = self.sock.recvfrom(1024)
-                message = data.decode('utf-8')
+        Args:
+            parsed_data: Leitura parseada (None se inválida)
+            addr: Endereço (ip, porta) do remetente
+        """
+        if not parsed_data:
+            return
+        # nan/inf passam pelo float() do parser, mas estragariam média, mínimo,
+        # máximo e o gráfico (que pula a checagem de valores finitos)
+        if not math.isfinite(parsed_data.value):
+            self._report_parse_error(ValueError(f"valor não finito: {parsed_data.value}"))
+            return
 
-                # Parse da mensagem
-                parsed_data = self.parse_csv_message(message)
-                if not parsed_data:
-                    continue
+        # Registra primeira conexão
+        if self.sensor_id is None:
+            self.sensor_id = parsed_data.sensor_id
+            self.client_address = addr
+            print(f"[INFO] Sensor conectado: {self.sensor_id} ({addr[0]}:{addr[1]})")
+
+        # Atualiza dados atuais
+        self.current_data = parsed_data
 
-                # Registra primeira conexão
-                if self.sensor_id is None:
-                    self.sensor_id = parsed_data.sensor_id
-                    self.client_address = addr
-                    print(f"[INFO] Sensor conectado: {self.sensor_id} ({addr[0]}:{addr[1]})")
+        # Atualiza estatísticas
+        self.update_stats(parsed_data)
 
-                # Atualiza dados atuais
-                self.current_data = parsed_data
+        # Chama callback se definido
+        if self.on_data_received:
+            self.on_data_received(parsed_data, self.get_stats())
 
-                # Atualiza estatísticas
-                self.update_stats(parsed_data)
+    def _receive_loop(self, reader: _SocketReader):
+        """
+        Loop de recepção de dados (executado em uma thread por worker)
 
-                # Chama callback se definido
-                if self.on_data_received:
-                    self.on_data_received(parsed_data, self.get_stats())
+        No caminho recvmmsg a espera (select), a chamada à libc via ctypes e a
+        tokenização Numba rodam sem o GIL; ele só é retomado para registrar as
+        leituras já parseadas e chamar os callbacks.
+
+        Args:
+            reader: Socket e buffers deste worker
+        """
+        if reader.cpu is not None:
+            try:
+                os.sched_setaffinity(0, {reader.cpu})  # 0 = thread atual no Linux
+            except OSError:
+                pass
+
+        # Compilação do Numba aqui, e não em init(), que roda na thread da GUI
+        reader.warm_up()
+
+        while self.running:
+            try:
+                if not reader.mmsg:
+                    nbytes, addr = reader.sock.recvfrom_into(reader.recv_buf, RECV_BUFFER_SIZE)
+                    batch = [(self.parse_csv_bytes(reader.recv_view[:nbytes]), addr)]
+                elif reader.batch_parser:
+                    batch = self._parse_batch(reader, reader.receive_batch())
+                else:
+                    mmsg = reader.mmsg
+                    batch = [(self.parse_csv_bytes(mmsg.payload(i)), mmsg.address(i))
+                             for i in range(reader.receive_batch())]
+
+                # Lote parseado localmente; o lock só cobre o estado compartilhado.
+                # Um erro ao registrar uma leitura não descarta o resto do lote
+                with self._lock:
+                    for parsed_data, addr in batch:
+                        try:
+                            self._accept(parsed_data, addr)
+                        except Exception as e:
+                            self._report_receive_error(e)
 
             except socket.timeout:
                 continue
             except Exception as e:
                 if self.running:  # Ignora erro se foi shutdown
-                    error_msg = f"Erro ao receber dados: {e}"
-                    if self.on_error:
-                        self.on_error(error_msg)
-                    print(f"❌ {error_msg}")
+                    self._report_receive_error(e)
+
+    def _report_receive_error(self, error: Exception):
+        """Informa um erro de recepção aos callbacks e ao console"""
+        error_msg = f"Erro ao receber dados: {error}"
+        if self.on_error:
+            self.on_error(error_msg)
+        print(f"❌ {error_msg}")
 
     def start(self) -> bool:
         """
@@ -251,20 +1047,42 @@ class UDPServer:
             return False
 
         self.running = True
-        self.thread = threading.Thread(target=self._receive_loop, daemon=True)
-        self.thread.start()
+        self.threads = [threading.Thread(target=self._receive_loop, args=(reader,), daemon=True)
+                        for reader in self.readers]
+        for thread in self.threads:
+            thread.start()
+        print(f"[INFO] Servidor UDP iniciado em {self.ip}:{self.port} "
+              f"({len(self.threads)} worker(s))")
         return True
 
     def stop(self):
-        """Para o servidor graciosamente"""
+        """
+        Para o servidor graciosamente
+
+        Acorda os workers parados no select (shutdown), espera todos com um
+        prazo único de 2 s e só então fecha os sockets. O socket de um worker
+        que ainda não terminou (ex.: compilando o Numba) não é fechado: o
+        descritor não pode ser reaproveitado enquanto um recvmmsg ainda pode
+        usá-lo, e o worker sai sozinho ao ver running False.
+        """
         self.running = False
-        if self.sock:
+        for reader in self.readers:
+            try:
+                # Em UDP sem connect o Linux retorna ENOTCONN, mas acorda o select
+                reader.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        deadline = time.monotonic() + 2.0
+        for thread in self.threads:
+            thread.join(timeout=max(0.0, deadline - time.monotonic()))
+        for reader, thread in zip(self.readers, self.threads):
+            if thread.is_alive():
+                print("[WARN] Worker UDP não encerrou no prazo; socket mantido aberto")
+                continue
             try:
-                self.sock.close()
-            except:
+                reader.sock.close()
+            except OSError:
                 pass
-        if self.thread:
-            self.thread.join(timeout=2.0)
         print("[INFO] Servidor UDP encerrado")
 
     def export_to_csv(self, filename: str) -> bool:
@@ -278,13 +1096,23 @@ class UDPServer:
             True se exportado com sucesso
         """
         try:
-            with open(filename, 'w') as f:
+            columns = self.get_history_columns()
+            sensors, timestamps = columns['sensor_id'], columns['timestamp']
+            values, units = columns['value'], columns['unit']
+            with open(filename, 'w', newline='') as f:
                 # Cabeçalho
                 f.write("sensor_id,timestamp,value,unit\n")
 
-                # Dados
-                for data in self.history:
-                    f.write(f"{data.sensor_id},{data.timestamp},{data.value},{data.unit}\n")
+                # Dados: campos nunca contêm vírgula (vieram de um split por vírgula),
+                # então cada bloco vira uma única string escrita de uma vez
+                for start in range(0, len(values), CSV_CHUNK_ROWS):
+                    chunk = slice(start, start + CSV_CHUNK_ROWS)
+                    f.write(''.join([
+                        f"{sensor_id},{timestamp},{value},{unit}\n"
+                        for sensor_id, timestamp, value, unit in zip(
+                            sensors[chunk].tolist(), timestamps[chunk].tolist(),
+                            values[chunk].tolist(), units[chunk].tolist())
+                    ]))
 
             print(f"[INFO] Dados exportados para {filename}")
             return True
@@ -7,8 +7,9 @@ Suporta exportação em PDF e XLSX com gráficos e estatísticas.
 """
 
 import os
+import threading
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from typing import BinaryIO, List, Dict, Optional, Sequence, Tuple, Union
 from io import BytesIO
 from zoneinfo import ZoneInfo
 
@@ -20,17 +21,214 @@ from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
 from openpyxl.utils import get_column_letter
 from openpyxl.drawing.image import Image as XLImage
+from PIL import Image as PILImage
+
+# xlsxwriter (opcional): XLSX gravado em fluxo (constant_memory); sem ele usa openpyxl
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
 
 import matplotlib.pyplot as plt
 import matplotlib
 matplotlib.use('Agg')  # Backend não-interativo
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
 # Timezone de Brasília
 TIMEZONE_BRASILIA = ZoneInfo("America/Sao_Paulo")
 
+# Estilos do PDF: constantes, montados uma única vez na importação
+PDF_STYLES = getSampleStyleSheet()
+
+PDF_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=PDF_STYLES['Heading1'],
+    fontSize=24,
+    textColor=colors.HexColor('#1f77b4'),
+    spaceAfter=6,
+    alignment=TA_CENTER,
+    fontName='Helvetica-Bold'
+)
+
+PDF_FOOTER_STYLE = ParagraphStyle(
+    'Footer',
+    parent=PDF_STYLES['Normal'],
+    fontSize=8,
+    textColor=colors.grey,
+    alignment=TA_CENTER
+)
+
+PDF_INFO_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#e8f4f8')),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+])
+
+PDF_STATS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f77b4')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f0f0f0')]),
+])
+
+PDF_DATA_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f77b4')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f0f0f0')]),
+])
+
+
+# Imagem do gráfico nos relatórios: JPEG em 72 dpi por padrão (cerca de metade do
+# tamanho e mais rápida de embutir) ou PNG em 100 dpi quando se pede alta resolução
+# (compressão zlib mínima: a imagem é transitória e o PDF a recomprime de qualquer forma)
+GRAPH_SAVE_OPTIONS = {'format': 'jpeg', 'dpi': 72, 'pil_kwargs': {'quality': 85, 'optimize': True}}
+GRAPH_HIRES_SAVE_OPTIONS = {'format': 'png', 'dpi': 100, 'pil_kwargs': {'compress_level': 1}}
+
+
+class GraphRenderer:
+    """
+    Renderiza o gráfico histórico dos relatórios em uma figura Agg reaproveitada.
+
+    A figura e seus artistas são criados na primeira chamada; as seguintes só
+    atualizam os dados, sem recriar figura, eixos e estilos a cada relatório.
+    Como a figura é compartilhada, renderizações de threads diferentes são serializadas.
+    """
+
+    _lock = threading.Lock()
+    _figure = None
+    _ax = None
+    _line = None
+    _threshold_line = None
+    _alert_area = None
+
+    @classmethod
+    def _setup(cls):
+        """Cria a figura, os eixos e os artistas fixos do gráfico."""
+        cls._figure = Figure(figsize=(10, 5), dpi=100)
+        FigureCanvasAgg(cls._figure)
+        ax = cls._ax = cls._figure.add_subplot(111)
+
+        cls._line, = ax.plot([], [], color='#0066cc', linewidth=2.5, marker='o',
+                             markersize=4, label='Vibração (ADC)', zorder=3)
+        cls._threshold_line = ax.axhline(y=0, color='#d32f2f', linestyle='--', linewidth=2,
+                                         label='Limite de Alerta', alpha=0.7, zorder=2)
+
+        ax.set_facecolor('#f8f9fa')
+        ax.grid(True, alpha=0.3, linestyle='--', linewidth=0.5, color='#cccccc', zorder=0)
+        ax.set_xlabel('Hora (Brasília)', fontsize=11, fontweight='bold', color='#333333')
+        ax.set_ylabel('Valor (ADC)', fontsize=11, fontweight='bold', color='#333333')
+        ax.tick_params(colors='#666666', labelsize=10)
+        for spine in ax.spines.values():
+            spine.set_color('#e0e0e0')
+            spine.set_linewidth(1)
+        ax.legend(loc='upper left', fontsize=10, framealpha=0.95)
+
+    @classmethod
+    def render(cls,
+               filename: Union[str, BinaryIO],
+               timestamps: Sequence[datetime],
+               values: Sequence[float],
+               threshold: float,
+               save_options: Optional[Dict] = None) -> bool:
+        """
+        Salva o gráfico histórico (PNG em 100 dpi, salvo outras opções).
+
+        Args:
+            filename: Caminho do arquivo de saída ou arquivo binário aberto
+            timestamps: Horários das leituras (já no fuso de exibição)
+            values: Valores lidos
+            threshold: Limiar de alerta
+            save_options: Argumentos de savefig (padrão: GRAPH_HIRES_SAVE_OPTIONS)
+
+        Returns:
+            True se sucesso, False caso contrário
+        """
+        if len(values) == 0:
+            return False
+        with cls._lock:
+            return cls._render(filename, timestamps, values, threshold,
+                               save_options or GRAPH_HIRES_SAVE_OPTIONS)
+
+    @classmethod
+    def render_image(cls,
+                     timestamps: Sequence[datetime],
+                     values: Sequence[float],
+                     threshold: float,
+                     hires: bool = False) -> Optional[bytes]:
+        """
+        Gera o gráfico histórico em memória (sem arquivo temporário).
+
+        Args:
+            timestamps: Horários das leituras (já no fuso de exibição)
+            values: Valores lidos
+            threshold: Limiar de alerta
+            hires: PNG em 100 dpi em vez do JPEG em 72 dpi
+
+        Returns:
+            Bytes da imagem, ou None se não houver dados
+        """
+        buffer = BytesIO()
+        options = GRAPH_HIRES_SAVE_OPTIONS if hires else GRAPH_SAVE_OPTIONS
+        if not cls.render(buffer, timestamps, values, threshold, options):
+            return None
+        return buffer.getvalue()
+
+    @classmethod
+    def _render(cls, filename: Union[str, BinaryIO], timestamps: Sequence[datetime],
+                values: Sequence[float], threshold: float, save_options: Dict) -> bool:
+        """Atualiza os artistas da figura compartilhada e salva a imagem (com o lock adquirido)."""
+        if cls._figure is None:
+            cls._setup()
+        ax = cls._ax
+
+        num_points = len(values)
+        time_points = range(num_points)
+        cls._line.set_data(time_points, values)
+        cls._threshold_line.set_ydata([threshold, threshold])
+
+        # A área acima do limite é um polígono: troca o antigo pelo novo
+        if cls._alert_area is not None:
+            cls._alert_area.remove()
+        cls._alert_area = ax.fill_between(time_points, threshold, max(max(values), threshold),
+                                          color='#d32f2f', alpha=0.1, zorder=1)
+
+        # Aproximadamente 5 horários no eixo X, sempre incluindo o último
+        interval = max(1, num_points // 5)
+        x_ticks = list(range(0, num_points, interval))
+        if x_ticks[-1] != num_points - 1:
+            x_ticks.append(num_points - 1)
+        ax.set_xticks(x_ticks)
+        ax.set_xticklabels([timestamps[i].strftime('%H:%M:%S') for i in x_ticks],
+                           rotation=45, ha='right')
+
+        ax.relim()
+        ax.autoscale_view()
+        cls._figure.tight_layout()
+        cls._figure.savefig(filename, **save_options)
+        return True
+
 
 class ReportExporter:
     """Classe base para exportação de relatórios."""
@@ -47,30 +245,63 @@ class ReportExporter:
         self.unit = unit
         self.timestamp = datetime.now(TIMEZONE_BRASILIA)
 
-    def _prepare_data(self, data_list: List[Dict]) -> pd.DataFrame:
-        """Converte lista de dados em DataFrame."""
-        df = pd.DataFrame(data_list)
-        if 'timestamp' in df.columns:
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
+    @staticmethod
+    def _graph_source(graph_image_path: Optional[str],
+                      graph_image_bytes: Optional[bytes]) -> Union[str, BytesIO, None]:
+        """Origem da imagem do gráfico: imagem em memória ou, na falta dela, arquivo existente."""
+        if graph_image_bytes:
+            return BytesIO(graph_image_bytes)
+        if graph_image_path and os.path.exists(graph_image_path):
+            return graph_image_path
+        return None
+
+    def _prepare_data(self, data_list: Union[List[Dict], pd.DataFrame]) -> pd.DataFrame:
+        """Converte lista de dados em DataFrame (DataFrames são usados diretamente)."""
+        df = data_list if isinstance(data_list, pd.DataFrame) else pd.DataFrame(data_list)
+        if 'timestamp' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['timestamp']):
+            # O protocolo garante ISO 8601: evita a inferência de formato linha a linha
+            df = df.assign(timestamp=pd.to_datetime(df['timestamp'], format='ISO8601'))
         return df
 
+    def _format_columns(self, df: pd.DataFrame, time_format: str) -> Tuple[list, list, list]:
+        """
+        Formata as colunas da tabela de dados de uma vez (sem iterar linhas).
+
+        Args:
+            df: DataFrame com as leituras
+            time_format: Formato strftime do timestamp
+
+        Returns:
+            Tupla (timestamps, valores, unidades) como listas
+        """
+        timestamps = df['timestamp']
+        if pd.api.types.is_datetime64_any_dtype(timestamps):
+            timestamps = timestamps.dt.strftime(time_format)
+        else:
+            timestamps = timestamps.astype(str)
+        values = df['value'].to_numpy()
+        units = df['unit'].tolist() if 'unit' in df.columns else [self.unit] * len(df)
+        return timestamps.tolist(), values, units
+
 
 class PDFReportExporter(ReportExporter):
     """Exportador de relatórios em formato PDF."""
 
     def export(self,
                filename: str,
-               data_list: List[Dict],
+               data_list: Union[List[Dict], pd.DataFrame],
                stats: Dict,
-               graph_image_path: Optional[str] = None) -> bool:
+               graph_image_path: Optional[str] = None,
+               graph_image_bytes: Optional[bytes] = None) -> bool:
         """
         Exporta relatório em PDF.
 
         Args:
             filename: Caminho do arquivo de saída
-            data_list: Lista de dados de vibração
+            data_list: Lista de dados de vibração ou DataFrame equivalente
             stats: Dicionário com estatísticas
             graph_image_path: Caminho para imagem do gráfico
+            graph_image_bytes: Imagem (PNG/JPEG) do gráfico em memória (tem precedência sobre o caminho)
 
         Returns:
             True se sucesso, False caso contrário
@@ -90,20 +321,10 @@ class PDFReportExporter(ReportExporter):
             )
 
             elements = []
-            styles = getSampleStyleSheet()
+            styles = PDF_STYLES
 
             # Título do relatório
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=24,
-                textColor=colors.HexColor('#1f77b4'),
-                spaceAfter=6,
-                alignment=TA_CENTER,
-                fontName='Helvetica-Bold'
-            )
-
-            elements.append(Paragraph("RELATÓRIO DE MONITORAMENTO", title_style))
+            elements.append(Paragraph("RELATÓRIO DE MONITORAMENTO", PDF_TITLE_STYLE))
             elements.append(Paragraph("Dados de Vibração", styles['Heading2']))
             elements.append(Spacer(1, 0.3*inch))
 
@@ -116,16 +337,7 @@ class PDFReportExporter(ReportExporter):
             ]
 
             info_table = Table(info_data, colWidths=[2.5*inch, 3.5*inch])
-            info_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#e8f4f8')),
-                ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                ('TOPPADDING', (0, 0), (-1, -1), 8),
-                ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-            ]))
+            info_table.setStyle(PDF_INFO_TABLE_STYLE)
 
             elements.append(info_table)
             elements.append(Spacer(1, 0.3*inch))
@@ -143,27 +355,18 @@ class PDFReportExporter(ReportExporter):
             ]
 
             stats_table = Table(stats_data, colWidths=[2.5*inch, 3.5*inch])
-            stats_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f77b4')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                ('TOPPADDING', (0, 0), (-1, -1), 8),
-                ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f0f0f0')]),
-            ]))
+            stats_table.setStyle(PDF_STATS_TABLE_STYLE)
 
             elements.append(stats_table)
             elements.append(Spacer(1, 0.3*inch))
 
             # Gráfico se disponível
-            if graph_image_path and os.path.exists(graph_image_path):
+            graph_image = self._graph_source(graph_image_path, graph_image_bytes)
+            if graph_image is not None:
                 elements.append(Paragraph("Gráfico Histórico", styles['Heading2']))
                 elements.append(Spacer(1, 0.15*inch))
                 try:
-                    img = Image(graph_image_path, width=6*inch, height=3*inch)
+                    img = Image(graph_image, width=6*inch, height=3*inch)
                     elements.append(img)
                     elements.append(Spacer(1, 0.2*inch))
                 except Exception as e:
@@ -177,44 +380,23 @@ class PDFReportExporter(ReportExporter):
             # Pega últimas 20 leituras
             df_last = df.tail(20).reset_index(drop=True)
 
+            timestamps, values, units = self._format_columns(df_last, "%H:%M:%S")
             table_data = [["#", "Timestamp", "Valor", "Unidade"]]
-            for idx, row in df_last.iterrows():
-                timestamp_str = row['timestamp'].strftime("%H:%M:%S") if hasattr(row['timestamp'], 'strftime') else str(row['timestamp'])
-                table_data.append([
-                    str(idx + 1),
-                    timestamp_str,
-                    f"{row['value']:.2f}",
-                    row.get('unit', self.unit)
-                ])
+            table_data += [
+                [str(idx), timestamp_str, f"{value:.2f}", unit]
+                for idx, (timestamp_str, value, unit) in enumerate(zip(timestamps, values, units), 1)
+            ]
 
             data_table = Table(table_data, colWidths=[0.8*inch, 2.5*inch, 1.5*inch, 1.2*inch])
-            data_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f77b4')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('FONTSIZE', (0, 1), (-1, -1), 9),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                ('TOPPADDING', (0, 0), (-1, -1), 6),
-                ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f0f0f0')]),
-            ]))
+            data_table.setStyle(PDF_DATA_TABLE_STYLE)
 
             elements.append(data_table)
 
             # Rodapé
             elements.append(Spacer(1, 0.5*inch))
-            footer_style = ParagraphStyle(
-                'Footer',
-                parent=styles['Normal'],
-                fontSize=8,
-                textColor=colors.grey,
-                alignment=TA_CENTER
-            )
             elements.append(Paragraph(
                 f"Relatório gerado em {self.timestamp.strftime('%d/%m/%Y às %H:%M:%S')}",
-                footer_style
+                PDF_FOOTER_STYLE
             ))
 
             # Constrói PDF
@@ -231,17 +413,19 @@ class XLSXReportExporter(ReportExporter):
 
     def export(self,
                filename: str,
-               data_list: List[Dict],
+               data_list: Union[List[Dict], pd.DataFrame],
                stats: Dict,
-               graph_image_path: Optional[str] = None) -> bool:
+               graph_image_path: Optional[str] = None,
+               graph_image_bytes: Optional[bytes] = None) -> bool:
         """
         Exporta relatório em XLSX.
 
         Args:
             filename: Caminho do arquivo de saída
-            data_list: Lista de dados de vibração
+            data_list: Lista de dados de vibração ou DataFrame equivalente
             stats: Dicionário com estatísticas
             graph_image_path: Caminho para imagem do gráfico
+            graph_image_bytes: Imagem (PNG/JPEG) do gráfico em memória (tem precedência sobre o caminho)
 
         Returns:
             True se sucesso, False caso contrário
@@ -249,153 +433,212 @@ class XLSXReportExporter(ReportExporter):
         try:
             # Prepara dados
             df = self._prepare_data(data_list)
+            graph_image = self._graph_source(graph_image_path, graph_image_bytes)
 
-            # Cria workbook
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Relatório"
-
-            # Define estilos
-            title_font = Font(size=18, bold=True, color="FFFFFF")
-            title_fill = PatternFill(start_color="1f77b4", end_color="1f77b4", fill_type="solid")
-            header_font = Font(size=11, bold=True, color="FFFFFF")
-            header_fill = PatternFill(start_color="1f77b4", end_color="1f77b4", fill_type="solid")
-            section_font = Font(size=12, bold=True, color="1f77b4")
-            data_fill = PatternFill(start_color="e8f4f8", end_color="e8f4f8", fill_type="solid")
-            border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
-
-            row = 1
-
-            # Título
-            ws.merge_cells(f'A{row}:D{row}')
-            title_cell = ws[f'A{row}']
-            title_cell.value = "RELATÓRIO DE MONITORAMENTO DE VIBRAÇÃO"
-            title_cell.font = title_font
-            title_cell.fill = title_fill
-            title_cell.alignment = Alignment(horizontal='center', vertical='center')
-            ws.row_dimensions[row].height = 25
-            row += 2
+            if xlsxwriter is not None:
+                self._write_xlsxwriter(filename, df, stats, graph_image)
+            else:
+                self._write_openpyxl(filename, df, stats, graph_image)
+            return True
 
-            # Informações gerais
-            ws[f'A{row}'].value = "Sensor ID"
-            ws[f'B{row}'].value = self.sensor_id
-            row += 1
+        except Exception as e:
+            print(f"Erro ao exportar XLSX: {e}")
+            return False
 
-            ws[f'A{row}'].value = "Data/Hora"
-            ws[f'B{row}'].value = self.timestamp.strftime("%d/%m/%Y %H:%M:%S")
-            row += 1
+    def _write_xlsxwriter(self, filename: str, df: pd.DataFrame, stats: Dict,
+                          graph_image: Union[str, BytesIO, None]):
+        """
+        Grava o relatório com xlsxwriter em modo constant_memory.
 
-            ws[f'A{row}'].value = "Unidade"
-            ws[f'B{row}'].value = self.unit
-            row += 1
+        Cada linha é gravada em disco assim que a próxima começa, então a memória
+        não cresce com o número de leituras. Formatos são objetos compartilhados.
+        """
+        # NaN (leitura inválida) vira #NUM! em vez de interromper a gravação
+        wb = xlsxwriter.Workbook(filename, {'constant_memory': True, 'nan_inf_to_errors': True})
+        try:
+            ws = wb.add_worksheet("Relatório")
+
+            title_format = wb.add_format({'font_size': 18, 'bold': True, 'font_color': '#FFFFFF',
+                                          'bg_color': '#1f77b4', 'align': 'center',
+                                          'valign': 'vcenter'})
+            section_format = wb.add_format({'font_size': 12, 'bold': True,
+                                            'font_color': '#1f77b4'})
+            header_format = wb.add_format({'font_size': 11, 'bold': True, 'font_color': '#FFFFFF',
+                                           'bg_color': '#1f77b4', 'align': 'center',
+                                           'valign': 'vcenter', 'border': 1})
+            data_format = wb.add_format({'align': 'center', 'valign': 'vcenter', 'border': 1})
+            data_alt_format = wb.add_format({'align': 'center', 'valign': 'vcenter', 'border': 1,
+                                             'bg_color': '#e8f4f8'})
+
+            # Largura das colunas
+            ws.set_column(0, 0, 18)
+            ws.set_column(1, 1, 25)
+            ws.set_column(2, 2, 15)
+            ws.set_column(3, 3, 12)
+
+            # Título (linhas numeradas a partir de 0 e gravadas em ordem)
+            ws.set_row(0, 25)
+            ws.merge_range(0, 0, 0, 3, "RELATÓRIO DE MONITORAMENTO DE VIBRAÇÃO", title_format)
 
-            ws[f'A{row}'].value = "Total de Leituras"
-            ws[f'B{row}'].value = len(df)
-            row += 2
+            # Informações gerais
+            ws.write_row(2, 0, ["Sensor ID", self.sensor_id])
+            ws.write_row(3, 0, ["Data/Hora", self.timestamp.strftime("%d/%m/%Y %H:%M:%S")])
+            ws.write_row(4, 0, ["Unidade", self.unit])
+            ws.write_row(5, 0, ["Total de Leituras", len(df)])
 
             # Seção de estatísticas
-            ws[f'A{row}'].value = "ESTATÍSTICAS"
-            ws[f'A{row}'].font = section_font
-            row += 1
-
-            ws[f'A{row}'].value = "Mínimo"
-            ws[f'B{row}'].value = stats.get('min', 0)
-            ws[f'C{row}'].value = self.unit
-            row += 1
-
-            ws[f'A{row}'].value = "Máximo"
-            ws[f'B{row}'].value = stats.get('max', 0)
-            ws[f'C{row}'].value = self.unit
-            row += 1
-
-            ws[f'A{row}'].value = "Média"
-            ws[f'B{row}'].value = stats.get('avg', 0)
-            ws[f'C{row}'].value = self.unit
-            row += 1
-
-            ws[f'A{row}'].value = "Eventos de Alerta"
-            ws[f'B{row}'].value = stats.get('alerts', 0)
-            row += 2
+            ws.write(7, 0, "ESTATÍSTICAS", section_format)
+            ws.write_row(8, 0, ["Mínimo", stats.get('min', 0), self.unit])
+            ws.write_row(9, 0, ["Máximo", stats.get('max', 0), self.unit])
+            ws.write_row(10, 0, ["Média", stats.get('avg', 0), self.unit])
+            ws.write_row(11, 0, ["Eventos de Alerta", stats.get('alerts', 0)])
 
             # Seção de dados
-            ws[f'A{row}'].value = "DADOS DETALHADOS"
-            ws[f'A{row}'].font = section_font
-            row += 1
-
-            # Cabeçalhos da tabela
-            headers = ['#', 'Timestamp', 'Valor', 'Unidade']
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=row, column=col)
-                cell.value = header
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = Alignment(horizontal='center', vertical='center')
-                cell.border = border
-
-            row += 1
-
-            # Dados
-            for idx, (_, record) in enumerate(df.iterrows(), 1):
-                ws.cell(row=row, column=1).value = idx
-                timestamp_str = record['timestamp'].strftime("%d/%m/%Y %H:%M:%S") if hasattr(record['timestamp'], 'strftime') else str(record['timestamp'])
-                ws.cell(row=row, column=2).value = timestamp_str
-                ws.cell(row=row, column=3).value = record['value']
-                ws.cell(row=row, column=4).value = record.get('unit', self.unit)
-
-                # Aplica formatação
-                for col in range(1, 5):
-                    cell = ws.cell(row=row, column=col)
-                    cell.alignment = Alignment(horizontal='center', vertical='center')
-                    cell.border = border
-                    if idx % 2 == 0:
-                        cell.fill = data_fill
-
+            ws.write(13, 0, "DADOS DETALHADOS", section_format)
+            ws.write_row(14, 0, ['#', 'Timestamp', 'Valor', 'Unidade'], header_format)
+
+            timestamps, values, units = self._format_columns(df, "%d/%m/%Y %H:%M:%S")
+            row = 15  # Primeira linha de dados
+            for idx, record in enumerate(zip(timestamps, values.tolist(), units), 1):
+                ws.write_row(row, 0, (idx,) + record,
+                             data_alt_format if idx % 2 == 0 else data_format)
                 row += 1
 
-            # Adiciona gráfico se disponível
-            if graph_image_path and os.path.exists(graph_image_path):
+            # Adiciona gráfico se disponível (500x300 px, como na versão openpyxl)
+            if graph_image is not None:
                 row += 1
-                ws.merge_cells(f'A{row}:D{row}')
-                ws[f'A{row}'].value = "GRÁFICO HISTÓRICO"
-                ws[f'A{row}'].font = section_font
+                ws.merge_range(row, 0, row, 3, "GRÁFICO HISTÓRICO", section_format)
                 row += 1
-
                 try:
-                    img = XLImage(graph_image_path)
-                    img.width = 500
-                    img.height = 300
-                    ws.add_image(img, f'A{row}')
-                    row += 15  # Espaço para a imagem
+                    if isinstance(graph_image, str):
+                        with open(graph_image, 'rb') as f:
+                            graph_image = BytesIO(f.read())
+                    # xlsxwriter só aceita escala, aplicada sobre o tamanho em 96 dpi:
+                    # tamanho e dpi lidos do cabeçalho da imagem (PNG ou JPEG)
+                    with PILImage.open(graph_image) as image:
+                        width, height = image.size
+                        x_dpi, y_dpi = image.info.get('dpi', (96, 96))
+                        extension = image.format.lower()
+                    graph_image.seek(0)
+                    ws.insert_image(row, 0, f'grafico.{extension}', {
+                        'image_data': graph_image,
+                        'x_scale': 500 / width * x_dpi / 96,
+                        'y_scale': 300 / height * y_dpi / 96,
+                    })
                 except Exception as e:
                     print(f"Aviso: Não foi possível incluir gráfico: {e}")
+        finally:
+            wb.close()
+
+    def _write_openpyxl(self, filename: str, df: pd.DataFrame, stats: Dict,
+                        graph_image: Union[str, BytesIO, None]):
+        """Grava o relatório com openpyxl em modo write-only (sem xlsxwriter instalado)."""
+        # Workbook write-only: as linhas vão direto para o arquivo, sem árvore de células
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Relatório")
+
+        # Define estilos (criados uma vez e atribuídos por referência)
+        title_font = Font(size=18, bold=True, color="FFFFFF")
+        title_fill = PatternFill(start_color="1f77b4", end_color="1f77b4", fill_type="solid")
+        section_font = Font(size=12, bold=True, color="1f77b4")
+        center = Alignment(horizontal='center', vertical='center')
+        border = Border(
+            left=Side(style='thin'),
+            right=Side(style='thin'),
+            top=Side(style='thin'),
+            bottom=Side(style='thin')
+        )
+        header_style = NamedStyle(name="Cabeçalho", font=Font(size=11, bold=True, color="FFFFFF"),
+                                  fill=title_fill, alignment=center, border=border)
+        data_style = NamedStyle(name="Dados", alignment=center, border=border)
+        data_alt_style = NamedStyle(name="Dados Alternados", alignment=center, border=border,
+                                    fill=PatternFill(start_color="e8f4f8", end_color="e8f4f8",
+                                                     fill_type="solid"))
+        for style in (header_style, data_style, data_alt_style):
+            wb.add_named_style(style)
+
+        # Largura das colunas (precisa ser definida antes da primeira linha)
+        ws.column_dimensions['A'].width = 18
+        ws.column_dimensions['B'].width = 25
+        ws.column_dimensions['C'].width = 15
+        ws.column_dimensions['D'].width = 12
+
+        def cell(value, font=None, style=None):
+            c = WriteOnlyCell(ws, value=value)
+            if font:
+                c.font = font
+            if style:
+                c.style = style.name
+            return c
+
+        # Título
+        title_cell = cell("RELATÓRIO DE MONITORAMENTO DE VIBRAÇÃO", title_font)
+        title_cell.fill = title_fill
+        title_cell.alignment = center
+        ws.merged_cells.add('A1:D1')
+        ws.row_dimensions[1].height = 25
+        ws.append([title_cell])
+        ws.append([])
+
+        # Informações gerais
+        ws.append(["Sensor ID", self.sensor_id])
+        ws.append(["Data/Hora", self.timestamp.strftime("%d/%m/%Y %H:%M:%S")])
+        ws.append(["Unidade", self.unit])
+        ws.append(["Total de Leituras", len(df)])
+        ws.append([])
+
+        # Seção de estatísticas
+        ws.append([cell("ESTATÍSTICAS", section_font)])
+        ws.append(["Mínimo", stats.get('min', 0), self.unit])
+        ws.append(["Máximo", stats.get('max', 0), self.unit])
+        ws.append(["Média", stats.get('avg', 0), self.unit])
+        ws.append(["Eventos de Alerta", stats.get('alerts', 0)])
+        ws.append([])
+
+        # Seção de dados
+        ws.append([cell("DADOS DETALHADOS", section_font)])
+
+        # Cabeçalhos da tabela
+        ws.append([cell(header, style=header_style)
+                   for header in ['#', 'Timestamp', 'Valor', 'Unidade']])
+        row = 16  # Primeira linha de dados
+
+        # Dados
+        timestamps, values, units = self._format_columns(df, "%d/%m/%Y %H:%M:%S")
+        for idx, record in enumerate(zip(timestamps, values.tolist(), units), 1):
+            style = data_alt_style if idx % 2 == 0 else data_style
+            ws.append([cell(idx, style=style)] +
+                      [cell(value, style=style) for value in record])
+            row += 1
 
-            # Ajusta largura das colunas
-            ws.column_dimensions['A'].width = 18
-            ws.column_dimensions['B'].width = 25
-            ws.column_dimensions['C'].width = 15
-            ws.column_dimensions['D'].width = 12
+        # Adiciona gráfico se disponível
+        if graph_image is not None:
+            row += 1
+            ws.append([])
+            ws.merged_cells.add(f'A{row}:D{row}')
+            ws.append([cell("GRÁFICO HISTÓRICO", section_font)])
+            row += 1
 
-            # Salva arquivo
-            wb.save(filename)
-            return True
+            try:
+                img = XLImage(graph_image)
+                img.width = 500
+                img.height = 300
+                ws.add_image(img, f'A{row}')
+            except Exception as e:
+                print(f"Aviso: Não foi possível incluir gráfico: {e}")
 
-        except Exception as e:
-            print(f"Erro ao exportar XLSX: {e}")
-            return False
+        # Salva arquivo
+        wb.save(filename)
 
 
 def export_report(export_format: str,
                  filename: str,
                  sensor_id: str,
-                 data_list: List[Dict],
+                 data_list: Union[List[Dict], pd.DataFrame],
                  stats: Dict,
                  unit: str = "ADC",
-                 graph_image_path: Optional[str] = None) -> bool:
+                 graph_image_path: Optional[str] = None,
+                 graph_image_bytes: Optional[bytes] = None) -> bool:
     """
     Função auxiliar para exportar relatório.
 
@@ -403,10 +646,11 @@ def export_report(export_format: str,
         export_format: Formato desejado ('pdf' ou 'xlsx')
         filename: Caminho do arquivo de saída
         sensor_id: ID do sensor
-        data_list: Lista de dados
+        data_list: Lista de dados ou DataFrame
         stats: Dicionário com estatísticas
         unit: Unidade de medida
         graph_image_path: Caminho para imagem do gráfico
+        graph_image_bytes: Imagem (PNG/JPEG) do gráfico em memória (tem precedência sobre o caminho)
 
     Returns:
         True se sucesso, False caso contrário
@@ -418,4 +662,4 @@ def export_report(export_format: str,
     else:
         raise ValueError(f"Formato não suportado: {export_format}")
 
-    return exporter.export(filename, data_list, stats, graph_image_path)
+    return exporter.export(filename, data_list, stats, graph_image_path, graph_image_bytes)
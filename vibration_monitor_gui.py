@@ -20,57 +20,565 @@ Funcionalidades:
 """
 
 import sys
-from datetime import datetime
-from typing import Dict
+from collections import deque
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Sequence, Tuple
 import os
-import tempfile
+import time
 from zoneinfo import ZoneInfo
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QSpinBox, QFileDialog, QMessageBox, QGridLayout,
-    QGroupBox, QTabWidget, QTableWidget, QTableWidgetItem
+    QGroupBox, QTabWidget, QTableView, QCheckBox
+)
+from PyQt5.QtCore import (
+    Qt, QTimer, pyqtSignal, QObject, QRunnable, QThreadPool,
+    QAbstractTableModel, QModelIndex
 )
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QObject
 from PyQt5.QtGui import QFont
 
-import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
+
+# pyqtgraph (opcional): gráfico em tempo real sem redesenho completo a cada pacote
+try:
+    import pyqtgraph as pg
+except ImportError:
+    pg = None
+
+# pyarrow (opcional): exportação do histórico em Parquet/Feather
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
 
 from gui_server import UDPServer, SensorData
-from report_exporter import export_report
+from report_exporter import export_report, GraphRenderer
 
 # Timezone de Brasília
 TIMEZONE_BRASILIA = ZoneInfo("America/Sao_Paulo")
+EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Leituras aguardando o próximo render; em sobrecarga as mais antigas são descartadas
+INCOMING_QUEUE_SIZE = 4096
+
+# Linhas por bloco na exportação CSV (uma escrita por bloco)
+CSV_CHUNK_ROWS = 10000
+
+# Cards de estatística: (título, atributo do rótulo, cor de destaque)
+STAT_CARDS = (
+    ("📊 Total de Leituras", "label_total_readings", "#0066cc"),
+    ("📉 Valor Mínimo", "label_min_value", "#2e7d32"),
+    ("📈 Valor Máximo", "label_max_value", "#d32f2f"),
+    ("📐 Valor Médio", "label_avg_value", "#f57c00"),
+    ("🚨 Eventos de Alerta", "label_alert_events", "#c2185b"),
+)
+
+# Folhas de estilo montadas uma vez no import e aplicadas só na janela principal:
+# cada widget é selecionado pelo objectName (ou propriedade), sem setStyleSheet próprio
+# (exceto as cores de status, trocadas nas transições de conexão e alerta)
+TAB_PAGE_STYLESHEET = """
+    #tabPage, #tabPage * {
+        background-color: #f5f7fa;
+    }
+"""
+
+# Cabeçalho: fundo e borda valem também para os rótulos dentro dele
+HEADER_STYLESHEET = """
+    #header, #header * {
+        background-color: #f8f9fa;
+        border-bottom: 1px solid #e0e0e0;
+    }
+"""
+
+TABS_STYLESHEET = """
+    QTabWidget#mainTabs::pane { border: none; }
+    QTabWidget#mainTabs QTabBar::tab {
+        background-color: #f8f9fa;
+        color: #333;
+        padding: 10px 20px;
+        margin-right: 2px;
+        border-bottom: 2px solid transparent;
+        font-weight: bold;
+    }
+    QTabWidget#mainTabs QTabBar::tab:selected {
+        background-color: #ffffff;
+        border-bottom: 2px solid #0066cc;
+        color: #0066cc;
+    }
+    QTabWidget#mainTabs QTabBar::tab:hover {
+        background-color: #eff2f5;
+    }
+"""
+
+# Cores fixas de texto por papel; as que mudam com o estado (conexão, alerta)
+# são aplicadas no próprio rótulo, e só nas transições
+TEXT_STYLESHEET = """
+    QLabel#mutedText {
+        color: #666666;
+    }
+    QLabel#accentText {
+        color: #0066cc;
+    }
+    QLabel#messageText {
+        color: #555555;
+    }
+    QCheckBox#configCheck {
+        color: #333333;
+    }
+"""
+
+CARD_STYLESHEET = """
+    QGroupBox#card {
+        font-weight: bold;
+        font-size: 13px;
+        border: 1px solid #e0e0e0;
+        border-radius: 8px;
+        margin-top: 10px;
+        padding: 15px;
+        background-color: #ffffff;
+    }
+    QGroupBox#card::title {
+        subcontrol-origin: margin;
+        left: 12px;
+        padding: 0 4px 0 4px;
+    }
+"""
+
+ACCENT_CARD_STYLESHEET = """
+    QGroupBox#card[accent="{color}"] {{
+        border-left: 4px solid {color};
+    }}
+    QGroupBox#card[accent="{color}"]::title, QGroupBox#card[accent="{color}"] QLabel {{
+        color: {color};
+    }}
+"""
+
+BUTTON_STYLESHEET = """
+    QPushButton#{name} {{
+        background-color: {base};
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-weight: bold;
+        font-size: 11px;
+    }}
+    QPushButton#{name}:hover {{
+        background-color: {hover};
+    }}
+    QPushButton#{name}:pressed {{
+        background-color: {pressed};
+    }}
+"""
+
+# objectName de cada cor de botão de ação
+BUTTON_NAMES = {'blue': 'btnBlue', 'red': 'btnRed', 'green': 'btnGreen'}
+
+BUTTON_STYLESHEETS = (
+    BUTTON_STYLESHEET.format(name='btnBlue', base='#0066cc', hover='#0052a3', pressed='#003d7a')
+    + BUTTON_STYLESHEET.format(name='btnRed', base='#d32f2f', hover='#b71c1c', pressed='#7f0000')
+    + BUTTON_STYLESHEET.format(name='btnGreen', base='#2e7d32', hover='#1b5e20', pressed='#003300')
+)
+
+SPINBOX_STYLESHEET = """
+    QSpinBox#configSpin {
+        padding: 5px;
+        border: 1px solid #e0e0e0;
+        border-radius: 4px;
+        background-color: #ffffff;
+        color: #333333;
+    }
+    QSpinBox#configSpin:focus {
+        border: 2px solid #0066cc;
+    }
+"""
+
+EVENT_TABLE_STYLESHEET = """
+    QTableView#eventTable {
+        background-color: #ffffff;
+        alternate-background-color: #f8f9fa;
+        gridline-color: #e0e0e0;
+        border: 1px solid #e0e0e0;
+        border-radius: 4px;
+    }
+    QTableView#eventTable::item {
+        padding: 8px;
+        border: none;
+    }
+    QTableView#eventTable QHeaderView::section {
+        background-color: #f0f0f0;
+        padding: 8px;
+        border: none;
+        border-bottom: 1px solid #e0e0e0;
+        font-weight: bold;
+        color: #333333;
+    }
+"""
+
+
+# Estilo geral da janela principal
+BASE_STYLESHEET = """
+    QMainWindow {
+        background-color: #f5f7fa;
+    }
+
+    QPushButton {
+        background-color: #0066cc;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 10px 20px;
+        font-weight: bold;
+        font-size: 11px;
+        min-height: 40px;
+    }
+
+    QPushButton:hover {
+        background-color: #0052a3;
+    }
+
+    QPushButton:pressed {
+        background-color: #003d7a;
+    }
+
+    QPushButton:disabled {
+        background-color: #cccccc;
+        color: #999999;
+    }
+
+    QLabel {
+        color: #333333;
+    }
+
+    QTableView {
+        background-color: #ffffff;
+        alternate-background-color: #f8f9fa;
+        gridline-color: #e0e0e0;
+        border: 1px solid #e0e0e0;
+        border-radius: 4px;
+    }
+
+    QTableView::item {
+        padding: 8px;
+        border: none;
+    }
+
+    QTableView::item:selected {
+        background-color: #d4e6f1;
+    }
+
+    QHeaderView::section {
+        background-color: #f0f0f0;
+        padding: 8px;
+        border: none;
+        border-bottom: 2px solid #0066cc;
+        font-weight: bold;
+        color: #333333;
+    }
+
+    QSpinBox, QComboBox {
+        padding: 8px;
+        border: 1px solid #e0e0e0;
+        border-radius: 4px;
+        background-color: #ffffff;
+        color: #333333;
+        selection-background-color: #0066cc;
+    }
+
+    QSpinBox:focus, QComboBox:focus {
+        border: 2px solid #0066cc;
+    }
+
+    QScrollBar:vertical {
+        border: none;
+        background-color: #f5f7fa;
+        width: 12px;
+        margin: 0px 0px 0px 0px;
+    }
+
+    QScrollBar::handle:vertical {
+        background-color: #c0c0c0;
+        border-radius: 6px;
+        min-height: 20px;
+    }
+
+    QScrollBar::handle:vertical:hover {
+        background-color: #a0a0a0;
+    }
+
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        border: none;
+        background: none;
+    }
+"""
+
+# Folha única da janela: regras gerais seguidas das específicas por objectName
+APP_STYLESHEET = (
+    BASE_STYLESHEET
+    + HEADER_STYLESHEET
+    + TABS_STYLESHEET
+    + TEXT_STYLESHEET
+    + TAB_PAGE_STYLESHEET
+    + CARD_STYLESHEET
+    + ''.join(ACCENT_CARD_STYLESHEET.format(color=color) for _, _, color in STAT_CARDS)
+    + BUTTON_STYLESHEETS
+    + SPINBOX_STYLESHEET
+    + EVENT_TABLE_STYLESHEET
+)
+
+
+def _to_brasilia(ts_us: int) -> datetime:
+    """Converte microssegundos desde a época (UTC) em datetime no fuso de Brasília"""
+    return (EPOCH_UTC + timedelta(microseconds=int(ts_us))).astimezone(TIMEZONE_BRASILIA)
+
+
+@lru_cache(maxsize=256)
+def _format_hms(second: int) -> str:
+    """Formata um segundo desde a época (UTC) como HH:MM:SS em Brasília (cache por segundo)"""
+    return _to_brasilia(second * 1_000_000).strftime('%H:%M:%S')
+
+
+@lru_cache(maxsize=256)
+def _iso_second_parts(second: int) -> Tuple[str, str]:
+    """Data/hora ISO (sem fração) e deslocamento UTC de um segundo em Brasília (cache por segundo)"""
+    iso = _to_brasilia(second * 1_000_000).isoformat()
+    return iso[:19], iso[19:]
+
+
+def _iso_brasilia(ts_us: int) -> str:
+    """Equivale a _to_brasilia(ts_us).isoformat(), mas converte o fuso uma vez por segundo"""
+    second, micro = divmod(ts_us, 1_000_000)
+    base, offset = _iso_second_parts(second)
+    return f"{base}.{micro:06d}{offset}" if micro else base + offset
+
+
+@lru_cache(maxsize=None)
+def _tick_indexes(num_points: int) -> Tuple[int, ...]:
+    """
+    Posições dos horários no eixo X: ~5 pontos igualmente espaçados, sempre com o último
+
+    Em regime (histórico cheio) num_points é sempre o mesmo, então o cálculo é feito
+    uma vez só e reaproveitado a cada render.
+    """
+    if num_points <= 0:
+        return ()
+    indexes = list(range(0, num_points, max(1, num_points // 5)))
+    if indexes[-1] != num_points - 1:
+        indexes.append(num_points - 1)
+    return tuple(indexes)
+
+
+@lru_cache(maxsize=None)
+def _font(size: int, bold: bool = False) -> QFont:
+    """Retorna a fonte da interface no tamanho dado, criada uma só vez por estilo"""
+    return QFont("Segoe UI", size, QFont.Bold if bold else QFont.Normal)
 
 
 class ServerSignals(QObject):
     """Sinais para comunicação entre servidor e GUI"""
-    data_received = pyqtSignal(dict)  # Emite dados e estatísticas
     error_occurred = pyqtSignal(str)  # Emite mensagens de erro
 
 
+class TaskSignals(QObject):
+    """Sinais de conclusão de tarefas executadas fora da thread da GUI"""
+    finished = pyqtSignal(bool, str)  # Sucesso e mensagem (caminho ou erro)
+    result = pyqtSignal(object)  # Retorno da função (emitido antes de finished, só em sucesso)
+
+
+class ExportTask(QRunnable):
+    """Executa uma exportação no QThreadPool e avisa a GUI ao terminar"""
+
+    def __init__(self, function, *args):
+        """
+        Args:
+            function: Função de exportação (retorno emitido em result; exceções viram erro)
+            *args: Argumentos repassados à função
+        """
+        super().__init__()
+        self.function = function
+        self.args = args
+        self.signals = TaskSignals()
+
+    def run(self):
+        """Executa a exportação na thread do pool"""
+        try:
+            result = self.function(*self.args)
+            self.signals.result.emit(result)
+            self.signals.finished.emit(True, "")
+        except Exception as e:
+            self.signals.finished.emit(False, str(e))
+
+
+def write_history_csv(filename: str, sensor_id: str, ts_us: np.ndarray, values: np.ndarray):
+    """
+    Grava o histórico da GUI em CSV com timestamps em Brasília
+
+    Args:
+        filename: Caminho do arquivo de saída
+        sensor_id: Identificador do sensor
+        ts_us: Horários em microssegundos desde a época (UTC)
+        values: Valores lidos
+    """
+    # Buffer de 1 MiB; cada bloco de linhas vira uma única string escrita de uma vez
+    with open(filename, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+        f.write("sensor_id,timestamp,value,unit\n")
+        for start in range(0, len(values), CSV_CHUNK_ROWS):
+            chunk = slice(start, start + CSV_CHUNK_ROWS)
+            f.write(''.join([
+                f"{sensor_id},{_iso_brasilia(ts)},{value},ADC\n"
+                for ts, value in zip(ts_us[chunk].tolist(), values[chunk].tolist())
+            ]))
+
+
+def write_history_arrow(filename: str, sensor_id: str, ts_us: np.ndarray, values: np.ndarray):
+    """
+    Grava o histórico da GUI em Parquet ou Feather (pela extensão do arquivo)
+
+    As colunas são as mesmas do CSV, mas tipadas: timestamp com fuso de Brasília,
+    value em float64 e sensor_id/unit codificados em dicionário.
+
+    Args:
+        filename: Caminho do arquivo de saída (.parquet ou .feather)
+        sensor_id: Identificador do sensor
+        ts_us: Horários em microssegundos desde a época (UTC)
+        values: Valores lidos
+    """
+    num_rows = len(values)
+    constant = pa.DictionaryArray.from_arrays
+    table = pa.table({
+        'sensor_id': constant(pa.array(np.zeros(num_rows, dtype=np.int32)), [sensor_id]),
+        'timestamp': pa.array(ts_us, type=pa.timestamp('us', tz=TIMEZONE_BRASILIA.key)),
+        'value': pa.array(values, type=pa.float64()),
+        'unit': constant(pa.array(np.zeros(num_rows, dtype=np.int32)), ['ADC']),
+    })
+    if filename.lower().endswith('.feather'):
+        feather.write_feather(table, filename, compression='zstd')
+    else:
+        pq.write_table(table, filename, compression='zstd')
+
+
+def write_report(fmt: str, filename: str, sensor_name: str, data: pd.DataFrame,
+                 stats: Dict, threshold: float, graph_image: Optional[bytes] = None,
+                 hires: bool = False):
+    """
+    Renderiza o gráfico e exporta um relatório (executado fora da thread da GUI)
+
+    Args:
+        fmt: Formato do relatório ('pdf' ou 'xlsx')
+        filename: Caminho do arquivo de saída
+        sensor_name: Nome do sensor exibido no relatório
+        data: Histórico com colunas 'sensor_id', 'timestamp', 'value' e 'unit'
+        stats: Estatísticas exibidas no relatório
+        threshold: Limiar de alerta desenhado no gráfico
+        graph_image: Imagem do gráfico já renderizada (None = renderizar aqui)
+        hires: Renderizar o gráfico em PNG 100 dpi em vez de JPEG 72 dpi
+
+    Returns:
+        Imagem do gráfico usada no relatório (para o cache da GUI), ou None
+    """
+    # Gráfico em memória: nenhuma imagem temporária para gravar, ler e apagar
+    if graph_image is None:
+        graph_image = GraphRenderer.render_image(data['timestamp'], data['value'].to_numpy(),
+                                                 threshold, hires)
+        if graph_image is None:
+            print("Aviso: Não foi possível salvar gráfico")
+    # Relatório escrito ao lado e renomeado no fim: nunca fica um arquivo pela metade
+    partial_filename = filename + '.part'
+    try:
+        if not export_report(fmt, partial_filename, sensor_name, data, stats, unit='ADC',
+                             graph_image_bytes=graph_image):
+            raise RuntimeError(f"Falha ao exportar relatório {fmt.upper()}")
+        os.replace(partial_filename, filename)
+    finally:
+        try:
+            os.unlink(partial_filename)
+        except FileNotFoundError:
+            pass
+    return graph_image
+
+
+class EventLogModel(QAbstractTableModel):
+    """Log de eventos limitado: as linhas são tuplas (horário, é_alerta, valor) em um deque"""
+
+    HEADERS = ("Timestamp", "Tipo", "Valor", "Status")
+    TYPE_COLUMN = 1
+    STATUS_COLUMN = 3
+    # Tipo e status vêm do booleano de alerta na exibição: textos compartilhados,
+    # indexados por False/True, nada guardado por linha
+    TYPE_TEXTS = ("NORMAL", "ALERTA")
+    STATUS_TEXTS = ("✓ OK", "⚠️  ALERTA")
+
+    def __init__(self, max_rows: int = 50, parent=None):
+        super().__init__(parent)
+        self.rows = deque(maxlen=max_rows)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            row = self.rows[index.row()]
+            column = index.column()
+            if column == self.TYPE_COLUMN:
+                return self.TYPE_TEXTS[row[1]]
+            if column == self.STATUS_COLUMN:
+                return self.STATUS_TEXTS[row[1]]
+            return row[column]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def extend(self, rows: Sequence[Tuple[str, bool, str]]):
+        """
+        Acrescenta várias linhas, descartando as mais antigas em uma única remoção
+
+        Args:
+            rows: Linhas (horário, é_alerta, valor) em ordem cronológica
+        """
+        max_rows = self.rows.maxlen
+        rows = rows[-max_rows:]
+        if not rows:
+            return
+        excess = len(self.rows) + len(rows) - max_rows
+        if excess > 0:
+            self.beginRemoveRows(QModelIndex(), 0, excess - 1)
+            for _ in range(excess):
+                self.rows.popleft()
+            self.endRemoveRows()
+        first = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self.rows.extend(rows)
+        self.endInsertRows()
+
+
 class ModernCard(QGroupBox):
     """Card moderno com sombra e estilo elevado"""
-    def __init__(self, title: str, parent=None):
+    def __init__(self, title: str, parent=None, accent: Optional[str] = None):
+        """
+        Args:
+            title: Título do card
+            parent: Widget pai
+            accent: Cor da borda esquerda e do título (cards de estatística)
+        """
         super().__init__(title, parent)
-        self.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                font-size: 13px;
-                border: 1px solid #e0e0e0;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding: 15px;
-                background-color: #ffffff;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 12px;
-                padding: 0 4px 0 4px;
-            }
-        """)
+        # Estilo vem de APP_STYLESHEET (QGroupBox#card e, com destaque, [accent="cor"])
+        self.setObjectName("card")
+        if accent is not None:
+            self.setProperty("accent", accent)
 
 
 class VibrationMonitorGUI(QMainWindow):
@@ -81,22 +589,65 @@ class VibrationMonitorGUI(QMainWindow):
         super().__init__()
         self.server = None
         self.signals = ServerSignals()
-        self.history_values = []  # Lista de valores para o gráfico
-        self.history_timestamps = []  # Lista de timestamps
-        self.chart_data = []  # Dados para o gráfico
+        self.max_graph_points = 60  # Máximo de pontos no gráfico
+
+        # Histórico do gráfico em buffer circular (inserção O(1), sem realocação)
+        self.history_values = np.zeros(self.max_graph_points, dtype=np.float64)
+        self.history_ts_us = np.zeros(self.max_graph_points, dtype=np.int64)  # UTC, µs
+        self.history_head = 0   # Próxima posição de escrita
+        self.history_count = 0  # Posições preenchidas
+        self.history_x = np.arange(self.max_graph_points, dtype=np.float64)  # Eixo X do gráfico
+
+        # Renderização limitada a update_interval: a thread do servidor só enfileira
+        # (leitura, estatísticas, horário em µs) e o timer da GUI consome a fila
+        self.incoming = deque(maxlen=INCOMING_QUEUE_SIZE)
+        self.pending_events = deque(maxlen=50)  # (é_alerta, valor, µs) para o próximo render
+        self.in_alert = False  # Leitura mais recente acima do limiar
+        self.alert_peak = 0.0  # Maior valor desde o início do alerta atual
+
+        # Log de eventos: modelo sobre deque limitado (a linha mais antiga sai sozinha)
+        self.event_model = EventLogModel(max_rows=50)
+        self.render_timer = None
+
+        # Estados visuais aplicados (setStyleSheet só quando mudam)
+        self.status_connected = False
+        self.alert_active = None  # None = ainda não exibido
+        self.label_texts = {}  # Último texto/número aplicado por rótulo (só reaplica quando muda)
+
+        # Estatísticas exibidas, em números (os relatórios leem daqui, não do texto dos rótulos)
+        self.stat_min = 0
+        self.stat_max = 0
+        self.stat_avg = 0.0
+        self.stat_alerts = 0
         self.figure = None  # Figura do matplotlib
         self.canvas = None  # Canvas do matplotlib
+        self.chart_background = None  # Fundo do gráfico (sem os artistas animados) para blit
+        self.chart_ylim = None  # Limites Y aplicados ao gráfico matplotlib
+        self.chart_ticks = None  # Posições do eixo X aplicadas ao gráfico matplotlib
+        self.chart_tick_texts = []  # Rótulos (horários) do eixo X, desenhados por blit
+        self.curve = None  # Curva do pyqtgraph (None = usando matplotlib)
+        self.axis_ticks = None  # Ticks (posição, horário) aplicados ao eixo X do pyqtgraph
 
         # Configurações
         self.alert_threshold = 5000  # Limiar de alerta
         self.update_interval = 500  # Intervalo de atualização em ms
-        self.max_graph_points = 60  # Máximo de pontos no gráfico
 
         # Configurações de salvamento automático
         self.auto_save_enabled = True  # Habilitar salvamento automático
         self.auto_save_interval = 300000  # Intervalo em ms (5 minutos)
         self.auto_save_timer = None  # Timer para salvamento automático
+        self.auto_save_running = False  # Relatório automático sendo gerado em segundo plano
+        self.report_exports_running = 0  # Relatórios manuais (PDF/XLSX) em segundo plano
+
+        self.report_hires = False  # Gráfico dos relatórios em PNG 100 dpi em vez de JPEG 72 dpi
+
+        # Imagem do gráfico dos relatórios manuais (em memória): reaproveitada enquanto
+        # histórico, limiar e resolução não mudam
+        self.graph_cache = None
+        self.graph_cache_key = None
         self.reports_dir = os.path.join(os.path.expanduser("~"), "Vibration_Reports")
+        # Pasta inicial dos diálogos de exportação: a última escolhida na sessão
+        self.last_export_dir = self.reports_dir
 
         # Criar diretório de relatórios se não existir
         os.makedirs(self.reports_dir, exist_ok=True)
@@ -123,30 +674,12 @@ class VibrationMonitorGUI(QMainWindow):
         header_layout = self._create_header()
         header_widget = QWidget()
         header_widget.setLayout(header_layout)
-        header_widget.setStyleSheet("background-color: #f8f9fa; border-bottom: 1px solid #e0e0e0;")
+        header_widget.setObjectName("header")
         main_layout.addWidget(header_widget)
 
         # Abas para diferentes visualizações
         tabs = QTabWidget()
-        tabs.setStyleSheet("""
-            QTabWidget::pane { border: none; }
-            QTabBar::tab {
-                background-color: #f8f9fa;
-                color: #333;
-                padding: 10px 20px;
-                margin-right: 2px;
-                border-bottom: 2px solid transparent;
-                font-weight: bold;
-            }
-            QTabBar::tab:selected {
-                background-color: #ffffff;
-                border-bottom: 2px solid #0066cc;
-                color: #0066cc;
-            }
-            QTabBar::tab:hover {
-                background-color: #eff2f5;
-            }
-        """)
+        tabs.setObjectName("mainTabs")
 
         # Aba 1: Visualização em Tempo Real
         tab_realtime = self._create_realtime_tab()
@@ -175,27 +708,22 @@ class VibrationMonitorGUI(QMainWindow):
 
         # Sensor ID
         self.label_sensor_id = QLabel("🔌 Sensor: Aguardando conexão...")
-        font_sensor = QFont("Segoe UI", 11, QFont.Bold)
-        self.label_sensor_id.setFont(font_sensor)
-        self.label_sensor_id.setStyleSheet("color: #333333;")
+        self.label_sensor_id.setFont(_font(11, bold=True))
 
         # Status de conexão
         self.label_status = QLabel("🔴 Status: Desconectado")
-        font_status = QFont("Segoe UI", 11, QFont.Bold)
-        self.label_status.setFont(font_status)
+        self.label_status.setFont(_font(11, bold=True))
         self.label_status.setStyleSheet("color: #d32f2f;")
 
         # Última atualização
         self.label_last_update = QLabel("⏱️  Última atualização: -")
-        font_update = QFont("Segoe UI", 10)
-        self.label_last_update.setFont(font_update)
-        self.label_last_update.setStyleSheet("color: #666666;")
+        self.label_last_update.setFont(_font(10))
+        self.label_last_update.setObjectName("mutedText")
 
         # Timer de salvamento automático
         self.label_auto_save_timer = QLabel("💾 Próximo salvamento em: -")
-        font_auto_save = QFont("Segoe UI", 10)
-        self.label_auto_save_timer.setFont(font_auto_save)
-        self.label_auto_save_timer.setStyleSheet("color: #0066cc;")
+        self.label_auto_save_timer.setFont(_font(10))
+        self.label_auto_save_timer.setObjectName("accentText")
 
         header_layout.addWidget(self.label_sensor_id)
         header_layout.addWidget(self.label_status)
@@ -208,7 +736,7 @@ class VibrationMonitorGUI(QMainWindow):
     def _create_realtime_tab(self) -> QWidget:
         """Cria aba de visualização em tempo real"""
         widget = QWidget()
-        widget.setStyleSheet("background-color: #f5f7fa;")
+        widget.setObjectName("tabPage")
         layout = QVBoxLayout()
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(15)
@@ -223,14 +751,14 @@ class VibrationMonitorGUI(QMainWindow):
         value_layout.setSpacing(10)
 
         self.label_current_value = QLabel("0")
-        self.label_current_value.setFont(QFont("Segoe UI", 80, QFont.Bold))
+        self.label_current_value.setFont(_font(80, bold=True))
         self.label_current_value.setAlignment(Qt.AlignCenter)
-        self.label_current_value.setStyleSheet("color: #0066cc;")
+        self.label_current_value.setObjectName("accentText")
 
         self.label_current_unit = QLabel("ADC")
-        self.label_current_unit.setFont(QFont("Segoe UI", 18, QFont.Bold))
+        self.label_current_unit.setFont(_font(18, bold=True))
         self.label_current_unit.setAlignment(Qt.AlignCenter)
-        self.label_current_unit.setStyleSheet("color: #666666;")
+        self.label_current_unit.setObjectName("mutedText")
 
         value_layout.addWidget(self.label_current_value)
         value_layout.addWidget(self.label_current_unit)
@@ -244,14 +772,14 @@ class VibrationMonitorGUI(QMainWindow):
         alert_layout.setSpacing(12)
 
         self.label_alert_status = QLabel("✅ Normal")
-        self.label_alert_status.setFont(QFont("Segoe UI", 24, QFont.Bold))
+        self.label_alert_status.setFont(_font(24, bold=True))
         self.label_alert_status.setAlignment(Qt.AlignCenter)
         self.label_alert_status.setStyleSheet("color: #2e7d32;")
 
         self.label_alert_message = QLabel("Nenhuma anomalia detectada")
-        self.label_alert_message.setFont(QFont("Segoe UI", 11))
+        self.label_alert_message.setFont(_font(11))
         self.label_alert_message.setAlignment(Qt.AlignCenter)
-        self.label_alert_message.setStyleSheet("color: #555555;")
+        self.label_alert_message.setObjectName("messageText")
         self.label_alert_message.setWordWrap(True)
 
         alert_layout.addWidget(self.label_alert_status)
@@ -263,24 +791,14 @@ class VibrationMonitorGUI(QMainWindow):
 
         layout.addLayout(top_layout)
 
-        # Gráfico de histórico com matplotlib
+        # Gráfico de histórico (pyqtgraph se disponível, senão matplotlib)
         graph_group = ModernCard("📊 Histórico de Vibração (Últimos 60 segundos)")
         graph_layout = QVBoxLayout()
 
-        self.figure = Figure(figsize=(12, 4), dpi=100, facecolor='white')
-        self.figure.patch.set_facecolor('#ffffff')
-        self.canvas = FigureCanvas(self.figure)
-
-        # Configurar estilo do gráfico
-        plt.style.use('seaborn-v0_8-darkgrid')
-        self.ax = self.figure.add_subplot(111)
-        self.ax.set_facecolor('#f8f9fa')
-        self.ax.grid(True, alpha=0.3, linestyle='--', linewidth=0.5)
-        self.ax.set_xlabel('Tempo (s)', fontsize=11, fontweight='bold', color='#333333')
-        self.ax.set_ylabel('Valor (ADC)', fontsize=11, fontweight='bold', color='#333333')
-        self.ax.tick_params(colors='#666666', labelsize=10)
-
-        graph_layout.addWidget(self.canvas)
+        if pg is not None:
+            graph_layout.addWidget(self._create_pyqtgraph_chart())
+        else:
+            graph_layout.addWidget(self._create_matplotlib_chart())
         graph_group.setLayout(graph_layout)
         graph_group.setMinimumHeight(300)
 
@@ -293,47 +811,15 @@ class VibrationMonitorGUI(QMainWindow):
         btn_clear = QPushButton("🗑️  Limpar Gráfico")
         btn_clear.setMinimumHeight(40)
         btn_clear.setMaximumWidth(200)
-        btn_clear.setFont(QFont("Segoe UI", 10, QFont.Bold))
-        btn_clear.setStyleSheet("""
-            QPushButton {
-                background-color: #0066cc;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #0052a3;
-            }
-            QPushButton:pressed {
-                background-color: #003d7a;
-            }
-        """)
+        btn_clear.setFont(_font(10, bold=True))
+        btn_clear.setObjectName(BUTTON_NAMES['blue'])
         btn_clear.clicked.connect(self.on_clear_graph)
 
         btn_export = QPushButton("💾 Exportar para CSV")
         btn_export.setMinimumHeight(40)
         btn_export.setMaximumWidth(200)
-        btn_export.setFont(QFont("Segoe UI", 10, QFont.Bold))
-        btn_export.setStyleSheet("""
-            QPushButton {
-                background-color: #0066cc;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #0052a3;
-            }
-            QPushButton:pressed {
-                background-color: #003d7a;
-            }
-        """)
+        btn_export.setFont(_font(10, bold=True))
+        btn_export.setObjectName(BUTTON_NAMES['blue'])
         btn_export.clicked.connect(self.on_export_csv)
 
         button_layout1.addWidget(btn_clear)
@@ -344,54 +830,22 @@ class VibrationMonitorGUI(QMainWindow):
         button_layout2 = QHBoxLayout()
         button_layout2.setSpacing(10)
 
-        btn_export_pdf = QPushButton("📄 Exportar para PDF")
-        btn_export_pdf.setMinimumHeight(40)
-        btn_export_pdf.setMaximumWidth(200)
-        btn_export_pdf.setFont(QFont("Segoe UI", 10, QFont.Bold))
-        btn_export_pdf.setStyleSheet("""
-            QPushButton {
-                background-color: #d32f2f;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #b71c1c;
-            }
-            QPushButton:pressed {
-                background-color: #7f0000;
-            }
-        """)
-        btn_export_pdf.clicked.connect(self.on_export_pdf)
-
-        btn_export_xlsx = QPushButton("📊 Exportar para XLSX")
-        btn_export_xlsx.setMinimumHeight(40)
-        btn_export_xlsx.setMaximumWidth(200)
-        btn_export_xlsx.setFont(QFont("Segoe UI", 10, QFont.Bold))
-        btn_export_xlsx.setStyleSheet("""
-            QPushButton {
-                background-color: #2e7d32;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #1b5e20;
-            }
-            QPushButton:pressed {
-                background-color: #003300;
-            }
-        """)
-        btn_export_xlsx.clicked.connect(self.on_export_xlsx)
-
-        button_layout2.addWidget(btn_export_pdf)
-        button_layout2.addWidget(btn_export_xlsx)
+        self.btn_export_pdf = QPushButton("📄 Exportar para PDF")
+        self.btn_export_pdf.setMinimumHeight(40)
+        self.btn_export_pdf.setMaximumWidth(200)
+        self.btn_export_pdf.setFont(_font(10, bold=True))
+        self.btn_export_pdf.setObjectName(BUTTON_NAMES['red'])
+        self.btn_export_pdf.clicked.connect(self.on_export_pdf)
+
+        self.btn_export_xlsx = QPushButton("📊 Exportar para XLSX")
+        self.btn_export_xlsx.setMinimumHeight(40)
+        self.btn_export_xlsx.setMaximumWidth(200)
+        self.btn_export_xlsx.setFont(_font(10, bold=True))
+        self.btn_export_xlsx.setObjectName(BUTTON_NAMES['green'])
+        self.btn_export_xlsx.clicked.connect(self.on_export_xlsx)
+
+        button_layout2.addWidget(self.btn_export_pdf)
+        button_layout2.addWidget(self.btn_export_xlsx)
         button_layout2.addStretch()
 
         layout.addLayout(button_layout1)
@@ -400,10 +854,87 @@ class VibrationMonitorGUI(QMainWindow):
         widget.setLayout(layout)
         return widget
 
+    def _create_pyqtgraph_chart(self) -> QWidget:
+        """Cria o gráfico de histórico com pyqtgraph (curva atualizada via setData)"""
+        pg.setConfigOptions(antialias=False)
+
+        self.plot_widget = pg.PlotWidget(background='#ffffff')
+        plot_item = self.plot_widget.getPlotItem()
+        plot_item.getViewBox().setBackgroundColor('#f8f9fa')
+        plot_item.showGrid(x=True, y=True, alpha=0.3)
+        label_style = {'color': '#333333', 'font-size': '11pt', 'font-weight': 'bold'}
+        plot_item.setLabel('bottom', 'Hora (Brasília)', **label_style)
+        plot_item.setLabel('left', 'Valor (ADC)', **label_style)
+        plot_item.addLegend(offset=(10, 10))
+        # Eixo X fixo na janela do histórico: só o eixo Y é reescalado a cada render
+        plot_item.setXRange(0, self.max_graph_points - 1, padding=0.02)
+        plot_item.enableAutoRange(x=False, y=True)
+        plot_item.setMouseEnabled(x=False, y=True)
+
+        # Área acima do limite e linha de limite (atualizadas, nunca recriadas)
+        self.alert_region = pg.LinearRegionItem(
+            orientation='horizontal', movable=False,
+            brush=pg.mkBrush(211, 47, 47, 25), pen=pg.mkPen(None))
+        self.alert_region.setZValue(-10)
+        plot_item.addItem(self.alert_region)
+        self.threshold_line = pg.InfiniteLine(
+            angle=0, pos=self.alert_threshold,
+            pen=pg.mkPen('#d32f2f', width=2, style=Qt.DashLine))
+        plot_item.addItem(self.threshold_line)
+        plot_item.legend.addItem(pg.PlotDataItem(pen=self.threshold_line.pen), 'Limite de Alerta')
+
+        self.curve = plot_item.plot(
+            pen=pg.mkPen('#0066cc', width=2.5), symbol='o', symbolSize=4,
+            symbolBrush='#0066cc', symbolPen=None, name='Vibração (ADC)')
+        # Históricos maiores que a largura em pixels são reduzidos por pico (em NumPy)
+        self.curve.setDownsampling(auto=True, method='peak')
+        self.curve.setClipToView(True)
+        return self.plot_widget
+
+    def _create_matplotlib_chart(self) -> QWidget:
+        """Cria o gráfico de histórico com matplotlib (sem pyqtgraph instalado)"""
+        self.figure = Figure(figsize=(12, 4), dpi=100, facecolor='white')
+        self.figure.patch.set_facecolor('#ffffff')
+        self.canvas = FigureCanvas(self.figure)
+
+        # Configurar estilo do gráfico direto nos eixos (sem alterar o rcParams global,
+        # que também é usado pelo GraphRenderer dos relatórios)
+        self.ax = self.figure.add_subplot(111)
+        self.ax.set_facecolor('#f8f9fa')
+        self.ax.set_axisbelow(True)
+        self.ax.grid(True, alpha=0.3, linestyle='--', linewidth=0.5, color='#cccccc', zorder=0)
+        self.ax.set_xlabel('Hora (Brasília)', fontsize=11, fontweight='bold', color='#333333')
+        self.ax.set_ylabel('Valor (ADC)', fontsize=11, fontweight='bold', color='#333333')
+        self.ax.tick_params(colors='#666666', labelsize=10, length=0)
+
+        # Configurar cores dos spines
+        for spine in self.ax.spines.values():
+            spine.set_color('#e0e0e0')
+            spine.set_linewidth(1)
+
+        self.ax.set_xlim(0, self.max_graph_points - 1)
+
+        # Linha principal, limite, área de alerta e legenda criados uma vez e animados:
+        # ficam fora do fundo em cache e são redesenhados por blit a cada render
+        self.line_main, = self.ax.plot([], [], color='#0066cc', linewidth=2.5, marker='o',
+                                       markersize=4, label='Vibração (ADC)', zorder=3,
+                                       solid_capstyle='round', animated=True)
+        self.line_threshold = self.ax.axhline(y=self.alert_threshold, color='#d32f2f',
+                                              linestyle='--', linewidth=2, label='Limite de Alerta',
+                                              alpha=0.7, zorder=2, animated=True)
+        self.fill_alert = Rectangle((0, self.alert_threshold), 0, 0, color='#d32f2f',
+                                    alpha=0.1, zorder=1, animated=True, visible=False)
+        self.ax.add_patch(self.fill_alert)
+        self.chart_legend = self.ax.legend(loc='upper left', fontsize=10, frameon=False)
+        self.chart_legend.set_animated(True)
+        self.line_threshold.set_visible(False)  # Só aparece com dados (a legenda já o inclui)
+        self.canvas.mpl_connect('draw_event', self._on_chart_draw)
+        return self.canvas
+
     def _create_statistics_tab(self) -> QWidget:
         """Cria aba de estatísticas"""
         widget = QWidget()
-        widget.setStyleSheet("background-color: #f5f7fa;")
+        widget.setObjectName("tabPage")
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(20, 20, 20, 20)
         main_layout.setSpacing(15)
@@ -412,46 +943,19 @@ class VibrationMonitorGUI(QMainWindow):
         grid_layout = QGridLayout()
         grid_layout.setSpacing(15)
 
-        # Estatísticas em cards modernos
-        stats = [
-            ("📊 Total de Leituras", "label_total_readings", "#0066cc"),
-            ("📉 Valor Mínimo", "label_min_value", "#2e7d32"),
-            ("📈 Valor Máximo", "label_max_value", "#d32f2f"),
-            ("📐 Valor Médio", "label_avg_value", "#f57c00"),
-            ("🚨 Eventos de Alerta", "label_alert_events", "#c2185b"),
-        ]
-
-        for idx, (stat_name, attr_name, color) in enumerate(stats):
+        # Estatísticas em cards modernos (cor do valor vem do destaque do card)
+        for idx, (stat_name, attr_name, color) in enumerate(STAT_CARDS):
             row = idx // 2
             col = idx % 2
 
             # Criar card
-            card = ModernCard(stat_name)
-            card.setStyleSheet(f"""
-                QGroupBox {{
-                    font-weight: bold;
-                    font-size: 13px;
-                    border: 1px solid #e0e0e0;
-                    border-left: 4px solid {color};
-                    border-radius: 8px;
-                    margin-top: 10px;
-                    padding: 15px;
-                    background-color: #ffffff;
-                }}
-                QGroupBox::title {{
-                    subcontrol-origin: margin;
-                    left: 12px;
-                    padding: 0 4px 0 4px;
-                    color: {color};
-                }}
-            """)
+            card = ModernCard(stat_name, accent=color)
 
             card_layout = QVBoxLayout()
 
             value_label = QLabel("0")
-            value_label.setFont(QFont("Segoe UI", 40, QFont.Bold))
+            value_label.setFont(_font(40, bold=True))
             value_label.setAlignment(Qt.AlignCenter)
-            value_label.setStyleSheet(f"color: {color};")
 
             setattr(self, attr_name, value_label)
 
@@ -470,7 +974,7 @@ class VibrationMonitorGUI(QMainWindow):
     def _create_config_tab(self) -> QWidget:
         """Cria aba de configurações"""
         widget = QWidget()
-        widget.setStyleSheet("background-color: #f5f7fa;")
+        widget.setObjectName("tabPage")
         layout = QVBoxLayout()
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(15)
@@ -482,32 +986,46 @@ class VibrationMonitorGUI(QMainWindow):
 
         threshold_layout = QHBoxLayout()
         label_threshold = QLabel("Limiar de Alerta (ADC):")
-        label_threshold.setFont(QFont("Segoe UI", 11, QFont.Bold))
-        label_threshold.setStyleSheet("color: #333333;")
+        label_threshold.setFont(_font(11, bold=True))
 
         self.spinbox_threshold = QSpinBox()
         self.spinbox_threshold.setRange(0, 65535)
         self.spinbox_threshold.setValue(self.alert_threshold)
         self.spinbox_threshold.valueChanged.connect(self.on_threshold_changed)
-        self.spinbox_threshold.setFont(QFont("Segoe UI", 11))
+        self.spinbox_threshold.setFont(_font(11))
         self.spinbox_threshold.setMinimumHeight(35)
-        self.spinbox_threshold.setStyleSheet("""
-            QSpinBox {
-                padding: 5px;
-                border: 1px solid #e0e0e0;
-                border-radius: 4px;
-                background-color: #ffffff;
-                color: #333333;
-            }
-            QSpinBox:focus {
-                border: 2px solid #0066cc;
-            }
-        """)
+        self.spinbox_threshold.setObjectName("configSpin")
 
         threshold_layout.addWidget(label_threshold)
         threshold_layout.addWidget(self.spinbox_threshold, 1)
 
+        # Intervalo de redesenho da interface (os dados continuam sendo todos registrados)
+        interval_layout = QHBoxLayout()
+        label_interval = QLabel("Intervalo de Atualização (ms):")
+        label_interval.setFont(_font(11, bold=True))
+
+        self.spinbox_update_interval = QSpinBox()
+        self.spinbox_update_interval.setRange(50, 5000)
+        self.spinbox_update_interval.setSingleStep(50)
+        self.spinbox_update_interval.setValue(self.update_interval)
+        self.spinbox_update_interval.valueChanged.connect(self.on_update_interval_changed)
+        self.spinbox_update_interval.setFont(_font(11))
+        self.spinbox_update_interval.setMinimumHeight(35)
+        self.spinbox_update_interval.setObjectName("configSpin")
+
+        interval_layout.addWidget(label_interval)
+        interval_layout.addWidget(self.spinbox_update_interval, 1)
+
+        # Resolução do gráfico nos relatórios (JPEG 72 dpi é menor e mais rápido)
+        self.checkbox_report_hires = QCheckBox("Gráfico dos relatórios em alta resolução (PNG)")
+        self.checkbox_report_hires.setFont(_font(11))
+        self.checkbox_report_hires.setObjectName("configCheck")
+        self.checkbox_report_hires.setChecked(self.report_hires)
+        self.checkbox_report_hires.toggled.connect(self.on_report_hires_changed)
+
         config_layout.addLayout(threshold_layout)
+        config_layout.addLayout(interval_layout)
+        config_layout.addWidget(self.checkbox_report_hires)
         config_group.setLayout(config_layout)
         layout.addWidget(config_group)
 
@@ -515,34 +1033,12 @@ class VibrationMonitorGUI(QMainWindow):
         log_group = ModernCard("📋 Registro de Eventos")
         log_layout = QVBoxLayout()
 
-        self.table_events = QTableWidget()
-        self.table_events.setColumnCount(4)
-        self.table_events.setHorizontalHeaderLabels(
-            ["Timestamp", "Tipo", "Valor", "Status"]
-        )
+        self.table_events = QTableView()
+        self.table_events.setModel(self.event_model)
+        self.table_events.verticalHeader().setVisible(False)
         self.table_events.setMinimumHeight(300)
-        self.table_events.setFont(QFont("Segoe UI", 10))
-        self.table_events.setStyleSheet("""
-            QTableWidget {
-                background-color: #ffffff;
-                alternate-background-color: #f8f9fa;
-                gridline-color: #e0e0e0;
-                border: 1px solid #e0e0e0;
-                border-radius: 4px;
-            }
-            QTableWidget::item {
-                padding: 8px;
-                border: none;
-            }
-            QHeaderView::section {
-                background-color: #f0f0f0;
-                padding: 8px;
-                border: none;
-                border-bottom: 1px solid #e0e0e0;
-                font-weight: bold;
-                color: #333333;
-            }
-        """)
+        self.table_events.setFont(_font(10))
+        self.table_events.setObjectName("eventTable")
         self.table_events.setAlternatingRowColors(True)
 
         log_layout.addWidget(self.table_events)
@@ -556,9 +1052,13 @@ class VibrationMonitorGUI(QMainWindow):
 
     def setup_signals(self):
         """Configura sinais e slots"""
-        self.signals.data_received.connect(self.on_data_received)
         self.signals.error_occurred.connect(self.on_error_received)
 
+        # A interface é redesenhada no máximo uma vez por update_interval
+        self.render_timer = QTimer(self)
+        self.render_timer.timeout.connect(self.render_latest)
+        self.render_timer.start(self.update_interval)
+
     def setup_server(self):
         """Inicializa e inicia o servidor UDP"""
         self.server = UDPServer()
@@ -593,58 +1093,46 @@ class VibrationMonitorGUI(QMainWindow):
             print(f"[INFO] Salvamento automático habilitado a cada {self.auto_save_interval // 1000} segundos")
 
     def save_auto_report(self):
-        """Salva automaticamente um relatório em PDF"""
-        if not self.server or not self.server.history:
+        """Salva automaticamente um relatório em PDF (gerado em segundo plano)"""
+        if not self.server or not self.server.history_count or self.auto_save_running:
             return
 
-        try:
-            data_list, stats, graph_image_path = self._get_report_data()
-
-            if not data_list:
-                return
-
-            # Gerar nome do arquivo com timestamp de Brasília
-            now_brasilia = datetime.now(TIMEZONE_BRASILIA)
-            timestamp_str = now_brasilia.strftime("%Y%m%d_%H%M%S")
-            sensor_id = self.label_sensor_id.text().replace("🔌 Sensor: ", "").replace(" ", "_")
-
-            filename = os.path.join(
-                self.reports_dir,
-                f"relatorio_{sensor_id}_{timestamp_str}.pdf"
-            )
+        data_list, stats = self._get_report_snapshot()
+        if data_list is None:
+            return
 
-            # Exportar relatório
-            success = export_report(
-                'pdf',
-                filename,
-                sensor_id.replace("_", " "),
-                data_list,
-                stats,
-                unit='ADC',
-                graph_image_path=graph_image_path
-            )
+        # Gerar nome do arquivo com timestamp de Brasília
+        now_brasilia = datetime.now(TIMEZONE_BRASILIA)
+        timestamp_str = now_brasilia.strftime("%Y%m%d_%H%M%S")
+        sensor_id = self.current_sensor_id().replace(" ", "_")
 
-            if success:
-                print(f"[INFO] Relatório salvo automaticamente: {filename}")
-                # Resetar tempo do último salvamento
-                self.last_auto_save_time = datetime.now(TIMEZONE_BRASILIA)
-            else:
-                print(f"[WARN] Falha ao salvar relatório automático: {filename}")
+        filename = os.path.join(
+            self.reports_dir,
+            f"relatorio_{sensor_id}_{timestamp_str}.pdf"
+        )
 
-        except Exception as e:
-            print(f"[ERROR] Erro ao salvar relatório automático: {e}")
-        finally:
-            # Limpar arquivo temporário do gráfico
-            if graph_image_path and os.path.exists(graph_image_path):
-                try:
-                    os.remove(graph_image_path)
-                except:
-                    pass
+        # Gráfico e PDF são gerados no QThreadPool; a GUI continua atualizando
+        self.auto_save_running = True
+        task = ExportTask(write_report, 'pdf', filename, sensor_id.replace("_", " "),
+                          data_list, stats, self.alert_threshold, None, self.report_hires)
+        task.signals.finished.connect(
+            lambda ok, error: self.on_auto_save_finished(filename, ok, error))
+        QThreadPool.globalInstance().start(task)
+
+    def on_auto_save_finished(self, filename: str, ok: bool, error: str):
+        """Registra o resultado do relatório automático gerado em segundo plano"""
+        self.auto_save_running = False
+        if ok:
+            print(f"[INFO] Relatório salvo automaticamente: {filename}")
+            # Resetar tempo do último salvamento
+            self.last_auto_save_time = datetime.now(TIMEZONE_BRASILIA)
+        else:
+            print(f"[WARN] Falha ao salvar relatório automático: {filename} ({error})")
 
     def update_auto_save_countdown(self):
         """Atualiza o countdown até o próximo salvamento automático"""
         if not self.auto_save_enabled or not hasattr(self, 'last_auto_save_time'):
-            self.label_auto_save_timer.setText("💾 Próximo salvamento em: -")
+            self.set_label_text(self.label_auto_save_timer, "💾 Próximo salvamento em: -")
             return
 
         # Calcular tempo restante
@@ -658,461 +1146,494 @@ class VibrationMonitorGUI(QMainWindow):
         minutes = remaining_seconds // 60
         seconds = remaining_seconds % 60
 
-        self.label_auto_save_timer.setText(
+        self.set_label_text(
+            self.label_auto_save_timer,
             f"💾 Próximo salvamento em: {minutes}m {seconds}s"
         )
 
     def on_server_data(self, data: SensorData, stats: Dict):
-        """Callback do servidor quando novos dados são recebidos"""
-        self.signals.data_received.emit({
-            'data': {
-                'sensor_id': data.sensor_id,
-                'timestamp': data.timestamp,
-                'value': data.value,
-                'unit': data.unit
-            },
-            'stats': stats
-        })
+        """
+        Callback do servidor quando novos dados são recebidos (thread do servidor)
+
+        Não gera eventos Qt por pacote: a leitura vai para uma fila limitada
+        (deque.append é atômico) consumida por render_latest.
+        """
+        # Horário de chegada como inteiro (µs UTC); só vira datetime ao ser exibido
+        self.incoming.append((data, stats, time.time_ns() // 1000))
 
     def on_server_error(self, error_msg: str):
         """Callback do servidor quando ocorre um erro"""
         self.signals.error_occurred.emit(error_msg)
 
-    def on_data_received(self, info: Dict):
-        """Slot para atualizar GUI quando novos dados chegam"""
-        data = info['data']
-        stats = info['stats']
+    def process_reading(self, data: SensorData, now_us: int):
+        """
+        Registra uma leitura da fila no histórico e nas transições de alerta
+
+        Args:
+            data: Leitura recebida
+            now_us: Horário de chegada em microssegundos desde a época (UTC)
+        """
+        value = data.value
+        self.append_history(value, now_us)
+
+        # Só as transições entram no log: início do alerta e retorno ao normal
+        # (com o pico do período), e não cada pacote acima do limiar
+        if value > self.alert_threshold:
+            if not self.in_alert:
+                self.in_alert = True
+                self.alert_peak = value
+                self.pending_events.append((True, value, now_us))
+            elif value > self.alert_peak:
+                self.alert_peak = value
+        elif self.in_alert:
+            self.in_alert = False
+            self.pending_events.append((False, self.alert_peak, now_us))
+
+    def render_latest(self):
+        """Consome a fila de leituras e atualiza a interface com a última (chamado pelo timer)"""
+        # Só o que já estava na fila: o servidor pode continuar enfileirando
+        pending = len(self.incoming)
+        if not pending:
+            return
+        for _ in range(pending):
+            data, stats, now_us = self.incoming.popleft()
+            self.process_reading(data, now_us)
 
         # Atualizar sensor ID
-        self.label_sensor_id.setText(f"🔌 Sensor: {data['sensor_id']}")
-        self.label_status.setText("🟢 Status: Conectado")
-        self.label_status.setStyleSheet("color: #2e7d32;")
+        self.set_label_text(self.label_sensor_id, f"🔌 Sensor: {data.sensor_id}")
+        if not self.status_connected:
+            self.label_status.setText("🟢 Status: Conectado")
+            self.label_status.setStyleSheet("color: #2e7d32;")
+            self.status_connected = True
 
         # Atualizar valor atual
-        self.label_current_value.setText(str(int(data['value'])))
-        self.label_current_unit.setText(data['unit'])
+        self.set_label_number(self.label_current_value, int(data.value))
+        self.set_label_text(self.label_current_unit, data.unit)
 
-        # Atualizar timestamp - usar horário atual do sistema (já em Brasília)
-        now_brasilia = datetime.now(TIMEZONE_BRASILIA)
-        self.label_last_update.setText(
-            f"⏱️  Última atualização: {now_brasilia.strftime('%H:%M:%S')} (BRT)"
+        # Atualizar timestamp (horário de chegada do pacote, em Brasília)
+        self.set_label_text(
+            self.label_last_update,
+            f"⏱️  Última atualização: {_format_hms(now_us // 1_000_000)} (BRT)"
         )
 
-        # Adicionar ao histórico com timestamp em Brasília
-        # Usar a hora atual do sistema para garantir que está em Brasília
-        self.history_values.append(data['value'])
-        self.history_timestamps.append(now_brasilia)
-
-        # Manter apenas últimos N pontos
-        if len(self.history_values) > self.max_graph_points:
-            self.history_values.pop(0)
-            self.history_timestamps.pop(0)
-
         # Atualizar gráfico
         self.update_chart()
 
-        # Verificar alerta
-        is_alert = data['value'] > self.alert_threshold
-        if is_alert:
-            self.label_alert_status.setText("🚨 ALERTA")
-            self.label_alert_status.setStyleSheet("color: #d32f2f;")
-            self.label_alert_message.setText("Vibração acima do limiar!")
-            self.add_event_log("ALERTA", data['value'])
-        else:
-            self.label_alert_status.setText("✅ Normal")
-            self.label_alert_status.setStyleSheet("color: #2e7d32;")
-            self.label_alert_message.setText("Nenhuma anomalia detectada")
+        # Verificar alerta (textos e cores só são reaplicados na transição)
+        is_alert = data.value > self.alert_threshold
+        if is_alert != self.alert_active:
+            self.alert_active = is_alert
+            if is_alert:
+                self.label_alert_status.setText("🚨 ALERTA")
+                self.label_alert_status.setStyleSheet("color: #d32f2f;")
+                self.label_alert_message.setText("Vibração acima do limiar!")
+            else:
+                self.label_alert_status.setText("✅ Normal")
+                self.label_alert_status.setStyleSheet("color: #2e7d32;")
+                self.label_alert_message.setText("Nenhuma anomalia detectada")
+
+        # Registrar as transições acumuladas desde o último render de uma vez
+        # (uma remoção e uma inserção no modelo, qualquer que seja o tamanho do lote)
+        if self.pending_events:
+            self.event_model.extend([
+                (_format_hms(ts_us // 1_000_000), is_alert, str(int(value)))
+                for is_alert, value, ts_us in self.pending_events
+            ])
+            self.pending_events.clear()
+
+        # Atualizar estatísticas (valores exibidos guardados para os relatórios)
+        self.stat_min = int(stats['min_value'])
+        self.stat_max = int(stats['max_value'])
+        self.stat_avg = round(stats['avg_value'], 2)
+        self.stat_alerts = stats['high_vibration_events']
+        self.set_label_number(self.label_total_readings, stats['total_readings'])
+        self.set_label_number(self.label_min_value, self.stat_min)
+        self.set_label_number(self.label_max_value, self.stat_max)
+        self.set_label_text(self.label_avg_value, "%.2f" % stats['avg_value'])
+        self.set_label_number(self.label_alert_events, self.stat_alerts)
+
+    def set_label_text(self, label: QLabel, text: str):
+        """
+        Aplica o texto ao rótulo apenas se mudou (setText sempre invalida o layout)
+
+        Args:
+            label: Rótulo a atualizar
+            text: Novo texto
+        """
+        if self.label_texts.get(label) != text:
+            self.label_texts[label] = text
+            label.setText(text)
 
-        # Atualizar estatísticas
-        self.label_total_readings.setText(str(stats['total_readings']))
-        self.label_min_value.setText(str(int(stats['min_value'])))
-        self.label_max_value.setText(str(int(stats['max_value'])))
-        self.label_avg_value.setText(f"{stats['avg_value']:.2f}")
-        self.label_alert_events.setText(str(stats['high_vibration_events']))
+    def set_label_number(self, label: QLabel, value: int):
+        """
+        Exibe um inteiro no rótulo apenas se mudou
+
+        O texto vem de str(): QLabel.setNum(int) só aceita o intervalo de um int
+        de 32 bits, e leituras podem passar disso.
+
+        Args:
+            label: Rótulo a atualizar
+            value: Novo valor
+        """
+        if self.label_texts.get(label) != value:
+            self.label_texts[label] = value
+            label.setText(str(value))
+
+    def append_history(self, value: float, ts_us: int):
+        """
+        Grava um ponto no buffer circular do histórico
+
+        Args:
+            value: Valor lido
+            ts_us: Horário da leitura em microssegundos desde a época (UTC)
+        """
+        head = self.history_head
+        self.history_values[head] = value
+        self.history_ts_us[head] = ts_us
+        self.history_head = (head + 1) % self.max_graph_points
+        if self.history_count < self.max_graph_points:
+            self.history_count += 1
+
+    def get_history(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Retorna o histórico do gráfico em ordem cronológica
+
+        Returns:
+            Tupla (timestamps em µs UTC, valores)
+        """
+        if self.history_count < self.max_graph_points:
+            return (self.history_ts_us[:self.history_count],
+                    self.history_values[:self.history_count])
+        head = self.history_head
+        return (np.concatenate((self.history_ts_us[head:], self.history_ts_us[:head])),
+                np.concatenate((self.history_values[head:], self.history_values[:head])))
 
     def on_error_received(self, error_msg: str):
         """Slot para exibir mensagens de erro"""
         print(f"[ERROR] {error_msg}")
 
     def update_chart(self):
-        """Atualiza o gráfico com os dados atuais usando matplotlib"""
+        """Atualiza o gráfico com os dados atuais"""
+        if self.curve is not None:
+            self._update_pyqtgraph_chart()
+            return
         if not self.figure or not self.canvas or not self.ax:
             return
 
-        # Limpar gráfico anterior
-        self.ax.clear()
-
-        # Plotar dados
-        if self.history_values:
-            time_points = range(len(self.history_values))
-
-            # Plotar linha principal
-            self.ax.plot(time_points, self.history_values,
-                        color='#0066cc', linewidth=2.5, marker='o',
-                        markersize=4, label='Vibração (ADC)', zorder=3)
-
-            # Plotar limite de alerta como linha tracejada
-            self.ax.axhline(y=self.alert_threshold, color='#d32f2f',
-                           linestyle='--', linewidth=2, label='Limite de Alerta',
-                           alpha=0.7, zorder=2)
-
-            # Preencher área acima do limite com cor vermelha translúcida
-            self.ax.fill_between(time_points, self.alert_threshold,
-                                max(self.history_values + [self.alert_threshold]),
-                                color='#d32f2f', alpha=0.1, zorder=1)
-
-            # Configurar labels e estilo
-            self.ax.set_facecolor('#f8f9fa')
-            self.ax.grid(True, alpha=0.3, linestyle='--', linewidth=0.5, color='#cccccc', zorder=0)
-            self.ax.set_xlabel('Hora (Brasília)', fontsize=11, fontweight='bold', color='#333333')
-            self.ax.set_ylabel('Valor (ADC)', fontsize=11, fontweight='bold', color='#333333')
-            self.ax.tick_params(colors='#666666', labelsize=10)
-
-            # Adicionar timestamps no eixo X
-            # Mostrar apenas um subconjunto de timestamps para não ficar congestionado
-            num_points = len(self.history_timestamps)
-            if num_points > 0:
-                # Determinar intervalo entre timestamps exibidos
-                interval = max(1, num_points // 5)  # Mostrar aproximadamente 5 timestamps
-                x_ticks = []
-                x_labels = []
-
-                for i in range(0, num_points, interval):
-                    x_ticks.append(i)
-                    # Os timestamps já estão em Brasília
-                    x_labels.append(self.history_timestamps[i].strftime('%H:%M:%S'))
-
-                # Adicionar o último ponto se não estiver incluído
-                if (num_points - 1) not in x_ticks:
-                    x_ticks.append(num_points - 1)
-                    x_labels.append(self.history_timestamps[-1].strftime('%H:%M:%S'))
-
-                self.ax.set_xticks(x_ticks)
-                self.ax.set_xticklabels(x_labels, rotation=45, ha='right')
-
-            # Configurar cores dos spines
-            for spine in self.ax.spines.values():
-                spine.set_color('#e0e0e0')
-                spine.set_linewidth(1)
-
-            # Adicionar legenda
-            self.ax.legend(loc='upper left', fontsize=10, framealpha=0.95)
-
-            # Ajustar layout
+        ts_us, values = self.get_history()
+        num_points = len(values)
+        threshold = self.alert_threshold
+        top = max(values.max(), threshold) if num_points else threshold
+
+        # Atualizar dados dos artistas existentes
+        self.line_main.set_data(self.history_x[:num_points], values)
+        self.line_threshold.set_ydata([threshold, threshold])
+        self.line_threshold.set_visible(num_points > 0)
+        # Área acima do limite com cor vermelha translúcida
+        self.fill_alert.set_bounds(0, threshold, max(num_points - 1, 0), top - threshold)
+        self.fill_alert.set_visible(num_points > 0)
+
+        # O fundo só é redesenhado quando eixos ou rótulos mudam; senão, blit
+        full_redraw = self.chart_background is None
+
+        # Limites Y: expandem na hora e só encolhem quando sobra mais da metade
+        low = min(values.min(), threshold) if num_points else threshold
+        span = top - low
+        margin = 0.05 * span if span else max(1.0, 0.05 * abs(top))
+        if (self.chart_ylim is None or low < self.chart_ylim[0] or top > self.chart_ylim[1]
+                or span + 2 * margin < 0.5 * (self.chart_ylim[1] - self.chart_ylim[0])):
+            self.chart_ylim = (low - margin, top + margin)
+            self.ax.set_ylim(*self.chart_ylim)
+            full_redraw = True
+
+        # Adicionar timestamps no eixo X
+        # Mostrar apenas um subconjunto de timestamps para não ficar congestionado
+        x_ticks = _tick_indexes(num_points)
+        x_labels = [_format_hms(int(ts_us[i]) // 1_000_000) for i in x_ticks]
+
+        # Posições mudam só enquanto o histórico enche; os horários mudam a cada
+        # render e por isso são textos animados, não rótulos do eixo
+        if x_ticks != self.chart_ticks:
+            self.chart_ticks = x_ticks
+            self.ax.set_xticks(x_ticks)
+            # Rótulos transparentes só reservam o espaço no tight_layout
+            self.ax.set_xticklabels(['00:00:00'] * len(x_ticks), rotation=45, ha='right', alpha=0)
+            for text in self.chart_tick_texts:
+                text.remove()
+            self.chart_tick_texts = []
+            if x_ticks:
+                tick = self.ax.xaxis.get_major_ticks()[0]
+                transform, _, _ = self.ax.get_xaxis_text1_transform(
+                    tick.get_pad() + tick.get_tick_padding())
+                self.chart_tick_texts = [
+                    self.ax.text(i, 0, '', transform=transform, rotation=45, ha='right',
+                                 va='top', fontsize=10, color='#666666', animated=True)
+                    for i in x_ticks
+                ]
+            full_redraw = True
+        for text, label in zip(self.chart_tick_texts, x_labels):
+            text.set_text(label)
+
+        if full_redraw:
+            # Ajustar layout; o draw_event guarda o novo fundo e desenha os artistas
             self.figure.tight_layout()
-
-        # Desenhar canvas
-        self.canvas.draw()
-
-    def add_event_log(self, event_type: str, value: float):
-        """Adiciona um evento ao log"""
-        row = self.table_events.rowCount()
-        self.table_events.insertRow(row)
-
-        # Usar horário atual do sistema (já em Brasília)
-        now_brasilia = datetime.now(TIMEZONE_BRASILIA)
-        timestamp_str = now_brasilia.strftime('%H:%M:%S')
-
-        self.table_events.setItem(row, 0, QTableWidgetItem(timestamp_str))
-        self.table_events.setItem(row, 1, QTableWidgetItem(event_type))
-        self.table_events.setItem(row, 2, QTableWidgetItem(str(int(value))))
-        self.table_events.setItem(
-            row, 3, QTableWidgetItem("⚠️  ALERTA" if event_type == "ALERTA" else "✓ OK")
-        )
-
-        # Manter apenas últimos 50 eventos
-        while self.table_events.rowCount() > 50:
-            self.table_events.removeRow(0)
+            self.canvas.draw()
+        else:
+            self.canvas.restore_region(self.chart_background)
+            self._draw_chart_artists()
+            self.canvas.blit(self.figure.bbox)
+
+    def _on_chart_draw(self, event):
+        """Guarda o fundo do gráfico após um redesenho completo e desenha os artistas animados"""
+        self.chart_background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_chart_artists()
+
+    def _draw_chart_artists(self):
+        """Desenha os artistas animados do gráfico matplotlib sobre o fundo"""
+        for artist in (self.fill_alert, self.line_threshold, self.line_main, self.chart_legend,
+                       *self.chart_tick_texts):
+            self.ax.draw_artist(artist)
+
+    def _update_pyqtgraph_chart(self):
+        """Atualiza curva, limite e rótulos do pyqtgraph sem recriar itens"""
+        ts_us, values = self.get_history()
+        num_points = len(values)
+        # O servidor descarta nan/inf (UDPServer._accept): o histórico só tem valores finitos
+        self.curve.setData(self.history_x[:num_points], values, skipFiniteCheck=True)
+        self.threshold_line.setValue(self.alert_threshold)
+        top = max(values.max(), self.alert_threshold) if num_points else self.alert_threshold
+        self.alert_region.setRegion((self.alert_threshold, top))
+
+        # Aproximadamente 5 horários no eixo X, sempre incluindo o último
+        ticks = [(i, _format_hms(int(ts_us[i]) // 1_000_000)) for i in _tick_indexes(num_points)]
+        # setTicks invalida o eixo inteiro: só quando posições ou horários mudam
+        if ticks != self.axis_ticks:
+            self.axis_ticks = ticks
+            self.plot_widget.getPlotItem().getAxis('bottom').setTicks([ticks])
 
     def on_threshold_changed(self, value: int):
         """Atualiza o limiar de alerta"""
         self.alert_threshold = value
 
+    def on_update_interval_changed(self, value: int):
+        """Atualiza o intervalo de redesenho da interface"""
+        self.update_interval = value
+        if self.render_timer is not None:
+            self.render_timer.setInterval(value)
+
+    def on_report_hires_changed(self, checked: bool):
+        """Alterna o gráfico dos relatórios entre PNG 100 dpi e JPEG 72 dpi"""
+        self.report_hires = checked
+
     def on_clear_graph(self):
         """Limpa o gráfico e o histórico"""
-        self.history_values.clear()
-        self.history_timestamps.clear()
+        self.history_head = 0
+        self.history_count = 0
         self.update_chart()
 
+    def current_sensor_id(self) -> str:
+        """ID do sensor para exportações (o do servidor, se já conhecido; senão SW420)"""
+        if self.server and self.server.sensor_id:
+            return self.server.sensor_id
+        return "SW420"
+
+    def ask_export_filename(self, title: str, file_filter: str) -> str:
+        """
+        Pede o arquivo de destino de uma exportação, abrindo na última pasta usada
+
+        Args:
+            title: Título do diálogo
+            file_filter: Filtros de arquivo do diálogo
+
+        Returns:
+            Caminho escolhido ("" se cancelado)
+        """
+        # Pasta conhecida em vez do diretório atual; links não são resolvidos
+        # (evita stat extra em montagens de rede)
+        filename, _ = QFileDialog.getSaveFileName(
+            self, title, self.last_export_dir, file_filter,
+            options=QFileDialog.DontResolveSymlinks
+        )
+        if filename:
+            self.last_export_dir = os.path.dirname(filename)
+        return filename
+
     def on_export_csv(self):
         """Exporta dados para arquivo CSV com timestamps em Brasília"""
-        if not self.history_values or not self.history_timestamps:
+        if not self.history_count:
             QMessageBox.warning(
                 self, "Aviso", "Nenhum dado para exportar ainda."
             )
             return
 
-        filename, _ = QFileDialog.getSaveFileName(
-            self, "Salvar dados como CSV", "", "CSV Files (*.csv)"
-        )
+        # Parquet/Feather só aparecem com o pyarrow instalado
+        file_filter = "CSV Files (*.csv)"
+        if pa is not None:
+            file_filter += ";;Parquet Files (*.parquet);;Feather Files (*.feather)"
+        filename = self.ask_export_filename("Salvar dados como CSV", file_filter)
 
         if filename:
-            try:
-                # Exportar CSV com timestamps da GUI (em Brasília)
-                with open(filename, 'w', encoding='utf-8') as f:
-                    # Cabeçalho
-                    f.write("sensor_id,timestamp,value,unit\n")
-
-                    # Dados
-                    sensor_id = "SW420"
-                    if self.server and self.server.sensor_id:
-                        sensor_id = self.server.sensor_id
-
-                    for i, value in enumerate(self.history_values):
-                        timestamp_str = self.history_timestamps[i].isoformat()
-                        f.write(f"{sensor_id},{timestamp_str},{value},ADC\n")
-
-                QMessageBox.information(
-                    self, "Sucesso", f"Dados exportados para:\n{filename}"
-                )
-            except Exception as e:
-                QMessageBox.critical(
-                    self, "Erro", f"Falha ao exportar dados:\n{str(e)}"
-                )
+            sensor_id = self.current_sensor_id()
+
+            writer = write_history_csv
+            if pa is not None and filename.lower().endswith(('.parquet', '.feather')):
+                writer = write_history_arrow
+
+            # Cópia do histórico: a GUI continua gravando no buffer durante a exportação
+            ts_us, values = self.get_history()
+            task = ExportTask(writer, filename, sensor_id, ts_us.copy(), values.copy())
+            task.signals.finished.connect(
+                lambda ok, error: self.on_export_csv_finished(filename, ok, error))
+            QThreadPool.globalInstance().start(task)
+
+    def on_export_csv_finished(self, filename: str, ok: bool, error: str):
+        """Informa o resultado da exportação CSV feita em segundo plano"""
+        if ok:
+            QMessageBox.information(
+                self, "Sucesso", f"Dados exportados para:\n{filename}"
+            )
+        else:
+            QMessageBox.critical(
+                self, "Erro", f"Falha ao exportar dados:\n{error}"
+            )
 
-    def _get_report_data(self) -> tuple:
+    def _get_report_snapshot(self) -> tuple:
         """
-        Prepara dados para exportação de relatório.
-        Retorna: (lista_dados, estatísticas, caminho_gráfico)
+        Copia o histórico e as estatísticas exibidas para um relatório.
+        Retorna: (DataFrame_dados, estatísticas)
         """
         # Usar histórico da GUI que tem timestamps em Brasília
-        if not self.history_values or not self.history_timestamps:
-            return None, None, None
-
-        # Converter histórico para lista de dicionários
-        data_list = []
-        for i, value in enumerate(self.history_values):
-            timestamp_str = self.history_timestamps[i].isoformat()
-
-            # Usar sensor_id do servidor se disponível
-            sensor_id = "SW420"
-            if self.server and self.server.sensor_id:
-                sensor_id = self.server.sensor_id
-
-            data_list.append({
-                'sensor_id': sensor_id,
-                'timestamp': timestamp_str,
-                'value': value,
-                'unit': 'ADC'
-            })
-
-        # Obter estatísticas dos labels
+        if not self.history_count:
+            return None, None
+
+        sensor_id = self.current_sensor_id()
+
+        # Converter histórico em DataFrame por colunas (sem um dicionário por leitura)
+        ts_us, values = self.get_history()
+        timestamps = pd.to_datetime(ts_us, unit='us', utc=True).tz_convert(TIMEZONE_BRASILIA)
+        data_list = pd.DataFrame({
+            'sensor_id': sensor_id,
+            'timestamp': timestamps,
+            'value': values,
+            'unit': 'ADC'
+        })
+
+        # Estatísticas exibidas nos cards
         stats = {
-            'min': float(self.label_min_value.text()) if self.label_min_value.text() else 0,
-            'max': float(self.label_max_value.text()) if self.label_max_value.text() else 0,
-            'avg': float(self.label_avg_value.text()) if self.label_avg_value.text() else 0,
-            'alerts': int(self.label_alert_events.text()) if self.label_alert_events.text() else 0,
+            'min': float(self.stat_min),
+            'max': float(self.stat_max),
+            'avg': self.stat_avg,
+            'alerts': self.stat_alerts,
         }
+        return data_list, stats
 
-        # Salvar gráfico atual em arquivo temporário
-        graph_image_path = None
-        try:
-            # Criar diretório temporário se não existir
-            temp_dir = tempfile.gettempdir()
-            graph_image_path = os.path.join(temp_dir, 'vibration_graph.png')
-
-            # Salvar figura do matplotlib
-            if self.figure and self.canvas:
-                self.figure.savefig(graph_image_path, dpi=100, bbox_inches='tight')
-        except Exception as e:
-            print(f"Aviso: Não foi possível salvar gráfico: {e}")
-            graph_image_path = None
+    def _get_report_data(self) -> tuple:
+        """
+        Prepara dados para exportação de relatório.
+        Retorna: (DataFrame_dados, estatísticas, imagem_gráfico, chave_do_gráfico)
 
-        return data_list, stats, graph_image_path
+        A imagem só vem do cache; sem cache ela é None e o gráfico é renderizado
+        na tarefa do QThreadPool, que devolve a imagem para o cache ao terminar.
+        """
+        data_list, stats = self._get_report_snapshot()
+        if data_list is None:
+            return None, None, None, None
+
+        # Mesmo histórico (tamanho, posição e última leitura), limiar e resolução: imagem pronta
+        cache_key = (self.history_count, self.history_head,
+                     int(self.history_ts_us[self.history_head - 1]), self.alert_threshold,
+                     self.report_hires)
+        if cache_key == self.graph_cache_key:
+            return data_list, stats, self.graph_cache, cache_key
+        return data_list, stats, None, cache_key
+
+    def store_graph_cache(self, cache_key: tuple, graph_image: Optional[bytes]):
+        """Guarda a imagem renderizada por uma tarefa de relatório para as próximas exportações"""
+        if graph_image is not None:
+            self.graph_cache, self.graph_cache_key = graph_image, cache_key
 
     def on_export_pdf(self):
         """Exporta relatório em formato PDF"""
-        data_list, stats, graph_image_path = self._get_report_data()
+        data_list, stats, graph_image, cache_key = self._get_report_data()
 
-        if not data_list:
+        if data_list is None:
             QMessageBox.warning(
                 self, "Aviso", "Nenhum dado para exportar ainda."
             )
             return
 
-        filename, _ = QFileDialog.getSaveFileName(
-            self, "Salvar relatório como PDF", "", "PDF Files (*.pdf)"
-        )
+        filename = self.ask_export_filename("Salvar relatório como PDF", "PDF Files (*.pdf)")
 
         if filename:
-            try:
-                sensor_id = self.label_sensor_id.text().replace("🔌 Sensor: ", "")
-                success = export_report(
-                    'pdf',
-                    filename,
-                    sensor_id,
-                    data_list,
-                    stats,
-                    unit='ADC',
-                    graph_image_path=graph_image_path
-                )
-
-                if success:
-                    QMessageBox.information(
-                        self, "Sucesso", f"Relatório PDF exportado para:\n{filename}"
-                    )
-                else:
-                    QMessageBox.critical(
-                        self, "Erro", "Falha ao exportar relatório PDF."
-                    )
-            except Exception as e:
-                QMessageBox.critical(
-                    self, "Erro", f"Erro ao exportar PDF:\n{str(e)}"
-                )
-            finally:
-                # Limpar arquivo temporário do gráfico
-                if graph_image_path and os.path.exists(graph_image_path):
-                    try:
-                        os.remove(graph_image_path)
-                    except:
-                        pass
+            self.start_report_export('pdf', filename, data_list, stats, graph_image, cache_key)
+
+    def start_report_export(self, fmt: str, filename: str, data_list: pd.DataFrame,
+                            stats: Dict, graph_image: Optional[bytes], cache_key: tuple):
+        """
+        Gera um relatório no QThreadPool; a GUI continua atualizando durante a exportação
+
+        Args:
+            fmt: Formato do relatório ('pdf' ou 'xlsx')
+            filename: Caminho do arquivo de saída
+            data_list: Cópia do histórico (de _get_report_data)
+            stats: Estatísticas exibidas no relatório
+            graph_image: Imagem do gráfico em cache (None = renderizar na tarefa)
+            cache_key: Chave do gráfico no momento da cópia do histórico
+        """
+        sensor_id = self.current_sensor_id()
+        # Botões desabilitados enquanto houver relatório manual em andamento
+        self.set_report_export_running(True)
+        task = ExportTask(write_report, fmt, filename, sensor_id, data_list, stats,
+                          self.alert_threshold, graph_image, self.report_hires)
+        task.signals.result.connect(lambda image: self.store_graph_cache(cache_key, image))
+        task.signals.finished.connect(
+            lambda ok, error: self.on_report_export_finished(fmt, filename, ok, error))
+        QThreadPool.globalInstance().start(task)
+
+    def set_report_export_running(self, running: bool):
+        """Conta os relatórios manuais em andamento; com algum ativo, botões desabilitados e cursor de ocupado"""
+        if running:
+            QApplication.setOverrideCursor(Qt.BusyCursor)
+            self.report_exports_running += 1
+        else:
+            QApplication.restoreOverrideCursor()
+            self.report_exports_running -= 1
+        idle = self.report_exports_running == 0
+        self.btn_export_pdf.setEnabled(idle)
+        self.btn_export_xlsx.setEnabled(idle)
+
+    def on_report_export_finished(self, fmt: str, filename: str, ok: bool, error: str):
+        """Informa o resultado do relatório manual gerado em segundo plano"""
+        self.set_report_export_running(False)
+        if ok:
+            QMessageBox.information(
+                self, "Sucesso", f"Relatório {fmt.upper()} exportado para:\n{filename}"
+            )
+        else:
+            QMessageBox.critical(
+                self, "Erro", f"Erro ao exportar {fmt.upper()}:\n{error}"
+            )
 
     def on_export_xlsx(self):
         """Exporta relatório em formato XLSX"""
-        data_list, stats, graph_image_path = self._get_report_data()
+        data_list, stats, graph_image, cache_key = self._get_report_data()
 
-        if not data_list:
+        if data_list is None:
             QMessageBox.warning(
                 self, "Aviso", "Nenhum dado para exportar ainda."
             )
             return
 
-        filename, _ = QFileDialog.getSaveFileName(
-            self, "Salvar relatório como XLSX", "", "Excel Files (*.xlsx)"
-        )
+        filename = self.ask_export_filename("Salvar relatório como XLSX", "Excel Files (*.xlsx)")
 
         if filename:
-            try:
-                sensor_id = self.label_sensor_id.text().replace("🔌 Sensor: ", "")
-                success = export_report(
-                    'xlsx',
-                    filename,
-                    sensor_id,
-                    data_list,
-                    stats,
-                    unit='ADC',
-                    graph_image_path=graph_image_path
-                )
-
-                if success:
-                    QMessageBox.information(
-                        self, "Sucesso", f"Relatório XLSX exportado para:\n{filename}"
-                    )
-                else:
-                    QMessageBox.critical(
-                        self, "Erro", "Falha ao exportar relatório XLSX."
-                    )
-            except Exception as e:
-                QMessageBox.critical(
-                    self, "Erro", f"Erro ao exportar XLSX:\n{str(e)}"
-                )
-            finally:
-                # Limpar arquivo temporário do gráfico
-                if graph_image_path and os.path.exists(graph_image_path):
-                    try:
-                        os.remove(graph_image_path)
-                    except:
-                        pass
+            self.start_report_export('xlsx', filename, data_list, stats, graph_image, cache_key)
 
     def apply_stylesheet(self):
-        """Aplica estilo CSS moderno à aplicação"""
-        stylesheet = """
-        QMainWindow {
-            background-color: #f5f7fa;
-        }
-
-        QPushButton {
-            background-color: #0066cc;
-            color: white;
-            border: none;
-            border-radius: 6px;
-            padding: 10px 20px;
-            font-weight: bold;
-            font-size: 11px;
-            min-height: 40px;
-        }
-
-        QPushButton:hover {
-            background-color: #0052a3;
-            padding: 10px 22px;
-        }
-
-        QPushButton:pressed {
-            background-color: #003d7a;
-            padding: 10px 18px;
-        }
-
-        QPushButton:disabled {
-            background-color: #cccccc;
-            color: #999999;
-        }
-
-        QLabel {
-            color: #333333;
-        }
-
-        QTableWidget {
-            background-color: #ffffff;
-            alternate-background-color: #f8f9fa;
-            gridline-color: #e0e0e0;
-            border: 1px solid #e0e0e0;
-            border-radius: 4px;
-        }
-
-        QTableWidget::item {
-            padding: 8px;
-            border: none;
-        }
-
-        QTableWidget::item:selected {
-            background-color: #d4e6f1;
-        }
-
-        QHeaderView::section {
-            background-color: #f0f0f0;
-            padding: 8px;
-            border: none;
-            border-bottom: 2px solid #0066cc;
-            font-weight: bold;
-            color: #333333;
-        }
-
-        QSpinBox, QComboBox {
-            padding: 8px;
-            border: 1px solid #e0e0e0;
-            border-radius: 4px;
-            background-color: #ffffff;
-            color: #333333;
-            selection-background-color: #0066cc;
-        }
-
-        QSpinBox:focus, QComboBox:focus {
-            border: 2px solid #0066cc;
-        }
-
-        QScrollBar:vertical {
-            border: none;
-            background-color: #f5f7fa;
-            width: 12px;
-            margin: 0px 0px 0px 0px;
-        }
-
-        QScrollBar::handle:vertical {
-            background-color: #c0c0c0;
-            border-radius: 6px;
-            min-height: 20px;
-        }
-
-        QScrollBar::handle:vertical:hover {
-            background-color: #a0a0a0;
-        }
-
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-            border: none;
-            background: none;
-        }
-        """
-        self.setStyleSheet(stylesheet)
+        """Aplica estilo CSS moderno à aplicação (só quando ainda não aplicado)"""
+        if self.styleSheet() == APP_STYLESHEET:
+            return
+        self.setStyleSheet(APP_STYLESHEET)
 
     def closeEvent(self, event):
         """Trata o fechamento da janela"""